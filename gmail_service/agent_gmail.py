@@ -1,16 +1,13 @@
 import os
 import base64
-import re
 import mimetypes
 import io
-from typing import Optional, List, Any, Dict
+import mmap
+from typing import Optional, List, Any
 from datetime import datetime
-from zoneinfo import ZoneInfo
-from tzlocal import get_localzone
 from email.message import EmailMessage
 
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
 
 from google.adk.agents import Agent
 from google.genai import types
@@ -29,6 +26,19 @@ from utils.time_utils import get_time_context
 MODEL = os.environ.get("MODEL", "gemini-2.5-flash")
 SCOPES = ["https://mail.google.com/", "https://www.googleapis.com/auth/drive.readonly"]
 
+# Messages above this size are sent through the media upload endpoint as raw
+# message/rfc822 octets instead of a base64url "raw" JSON field (~33% smaller).
+MEDIA_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+MEDIA_UPLOAD_CHUNKSIZE = 4 * 1024 * 1024
+
+# Google-native Drive files have no binary content; get_media rejects them,
+# so they are exported to a portable format instead.
+NATIVE_EXPORT = {
+    "application/vnd.google-apps.document": "application/pdf",
+    "application/vnd.google-apps.spreadsheet": "text/csv",
+    "application/vnd.google-apps.presentation": "application/pdf",
+}
+
 # ======================================================
 # Authentication Bootstrap
 # ======================================================
@@ -132,22 +142,51 @@ def _build_mime_message(
     # Local file attachments (if any)
     if attachments:
         for path in attachments:
-            if not os.path.exists(path):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
                 continue
             ctype, _ = mimetypes.guess_type(path)
             if ctype is None:
                 ctype = "application/octet-stream"
             maintype, subtype = ctype.split("/", 1)
-            with open(path, "rb") as f:
-                data = f.read()
-            msg.add_attachment(data, maintype=maintype, subtype=subtype, filename=os.path.basename(path))
+            filename = os.path.basename(path)
+            if not st.st_size:
+                msg.add_attachment(b"", maintype=maintype, subtype=subtype, filename=filename)
+                continue
+            # Map the file instead of reading it: add_attachment base64-encodes
+            # straight from the mapping, so no full-size bytes copy is made.
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    msg.add_attachment(view, maintype=maintype, subtype=subtype, filename=filename)
     return msg
 
 
-def _encode_message(msg: EmailMessage) -> dict[str, str]:
-    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
+def _encode_message(raw_bytes: bytes) -> dict[str, str]:
+    raw = base64.urlsafe_b64encode(raw_bytes).decode("utf-8")
     return {"raw": raw}
 
+
+def _send_raw(gmail, raw_bytes: bytes) -> dict:
+    """Send an RFC5322 message, using a resumable media upload for large ones."""
+    messages = gmail.users().messages()
+    if len(raw_bytes) <= MEDIA_UPLOAD_THRESHOLD:
+        return messages.send(userId="me", body=_encode_message(raw_bytes)).execute()
+
+    from googleapiclient.http import MediaIoBaseUpload
+
+    media = MediaIoBaseUpload(
+        io.BytesIO(raw_bytes),
+        mimetype="message/rfc822",
+        resumable=True,
+        chunksize=MEDIA_UPLOAD_CHUNKSIZE,
+    )
+    request = messages.send(userId="me", media_body=media)
+    sent = None
+    while sent is None:
+        _, sent = request.next_chunk()
+    return sent
+
 # ======================================================
 # Gmail Tools
 # ======================================================
@@ -174,18 +213,28 @@ def send_email(
       - Google Drive file attachments (downloaded temporarily)
     """
     gmail = get_gmail_service()
-    drive = get_drive_service()
     msg = _build_mime_message(to, subject, body_text, cc=cc, bcc=bcc, attachments=attachments)
 
     # Add attachments from Google Drive
     if drive_file_ids:
+        from googleapiclient.http import MediaIoBaseDownload
+
+        drive = get_drive_service()
         for fid in drive_file_ids:
             try:
                 meta = drive.files().get(fileId=fid, fields="id,name,mimeType").execute()
                 name = meta.get("name", f"drive_file_{fid}")
                 mime = meta.get("mimeType", "application/octet-stream")
+                export_mime = NATIVE_EXPORT.get(mime)
+                if export_mime:
+                    req = drive.files().export_media(fileId=fid, mimeType=export_mime)
+                    mime = export_mime
+                    ext = mimetypes.guess_extension(export_mime)
+                    if ext and not name.lower().endswith(ext):
+                        name += ext
+                else:
+                    req = drive.files().get_media(fileId=fid)
                 maintype, subtype = mime.split("/", 1)
-                req = drive.files().get_media(fileId=fid)
                 fh = io.BytesIO()
                 downloader = MediaIoBaseDownload(fh, req)
                 done = False
@@ -196,8 +245,7 @@ def send_email(
             except Exception as e:
                 print(f"[GMAIL] Failed to attach Drive file {fid}: {e}")
 
-    encoded = _encode_message(msg)
-    sent = gmail.users().messages().send(userId="me", body=encoded).execute()
+    sent = _send_raw(gmail, msg.as_bytes())
     return f"Email sent successfully. Message ID: {sent.get('id')}"
 
 # ======================================================
@@ -250,12 +298,33 @@ def search_messages(query: str, max_results: Optional[int] = None) -> list[str]:
             return [f"No messages found for query: {query}"]
 
         formatted_results: list[str] = []
+        lower = str.lower
         for m in messages[: (max_results or len(messages))]:
-            msg = service.users().messages().get(userId="me", id=m["id"], format="metadata").execute()
+            msg = service.users().messages().get(
+                userId="me",
+                id=m["id"],
+                format="metadata",
+                metadataHeaders=["Subject", "From", "Date"],
+            ).execute()
             headers = msg.get("payload", {}).get("headers", [])
-            subject = next((h["value"] for h in headers if h["name"].lower() == "subject"), "(no subject)")
-            sender = next((h["value"] for h in headers if h["name"].lower() == "from"), "(unknown sender)")
-            date = next((h["value"] for h in headers if h["name"].lower() == "date"), "")
+            subject = sender = date = None
+            # Single pass over the headers; stop once all three are found.
+            for h in headers:
+                n = lower(h["name"])
+                if n == "subject":
+                    subject = h["value"]
+                elif n == "from":
+                    sender = h["value"]
+                elif n == "date":
+                    date = h["value"]
+                if subject is not None and sender is not None and date is not None:
+                    break
+            if subject is None:
+                subject = "(no subject)"
+            if sender is None:
+                sender = "(unknown sender)"
+            if date is None:
+                date = ""
             snippet = msg.get("snippet", "")[:100]
             formatted_results.append(
                 f"📧 {subject}\nFrom: {sender}\nDate: {date}\nSnippet: {snippet}"
@@ -1,22 +1,27 @@
+import io
+import itertools
 import os
 import json
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 from datetime import datetime
-from zoneinfo import ZoneInfo
-from tzlocal import get_localzone
 
 # Import centralized time utilities. We use get_time_context to obtain
 # current time data in a unified way across all modules. This allows
 # consistent timezone handling and formatting throughout the project.
-from utils.time_utils import get_time_context
+from utils.time_utils import MODIFIED_TIME_FORMAT, get_time_context_raw, local_timezone
 
 from googleapiclient.errors import HttpError
+from cachetools import TTLCache
 
 from google.adk.agents import Agent
 from google.genai import types
 
 # Import centralized helper for Google API authentication and service construction.
-from utils.google_service_helpers import get_google_service
+from utils.google_service_helpers import get_bundle, get_thread_http
+from utils import drive_cache
+from utils.rate_limit import execute
 
 # Load the model name from environment variables if available. Defaults to
 # 'gemini-2.5-flash' when not provided. Centralizing this variable allows
@@ -28,6 +33,19 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.readonly",
 ]
 
+# Partial-response mask: only the text runs get_doc_content renders, instead
+# of every style, list and inline object in the document.
+DOC_TEXT_FIELDS = "title,body(content(paragraph(elements(textRun(content)))))"
+
+# Parallel fetch settings for get_many_doc_contents.
+MAX_FETCH_WORKERS = 8
+
+# Doc metadata observed by list_docs, keyed by document ID, so
+# get_doc_modified_time can answer without a Drive call while it is fresh.
+META_TTL = 60.0
+_META_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=META_TTL)
+_META_LOCK = threading.Lock()
+
 # ------------------------------------------
 # Auth Bootstrap
 # ------------------------------------------
@@ -36,26 +54,63 @@ def get_docs_service() -> object:
     Return an authenticated Google Docs service.
 
     This function delegates credential handling to the centralized helper
-    defined in utils.google_service_helpers. By using get_google_service,
-    we avoid duplicating OAuth flow logic here. The SCOPES constant
-    specifies the permissions needed for Docs operations.
+    defined in utils.google_service_helpers. The Docs and Drive services
+    come from one ServiceBundle, so they share a single Credentials object
+    instead of each loading token.json. The SCOPES constant specifies the
+    permissions needed for Docs operations.
     """
-    return get_google_service("docs", "v1", SCOPES, "DOCS")
+    return get_bundle(SCOPES, "DOCS").docs
 
 
 def get_drive_service() -> object:
     """
     Return an authenticated Google Drive service with the same scopes
-    used for Docs. This is used to list and retrieve documents from
-    Google Drive when the user asks to view or search for Docs files.
+    (and credentials) used for Docs. This is used to list and retrieve
+    documents from Google Drive when the user asks to view or search for
+    Docs files.
     """
-    return get_google_service("drive", "v3", SCOPES, "DOCS/DRIVE")
+    return get_bundle(SCOPES, "DOCS").drive
 
 
 # ------------------------------------------
 # Tools
 # ------------------------------------------
-def list_docs(max_results: Optional[int] = None) -> List[str]:
+_LIST_DOCS_PARAMS = {
+    "q": "mimeType='application/vnd.google-apps.document' and trashed=false",
+    "fields": "nextPageToken, files(id,name,modifiedTime,webViewLink)",
+    "orderBy": "modifiedTime desc",
+    # Include documents from shared drives and shared resources
+    "supportsAllDrives": True,
+    "includeItemsFromAllDrives": True,
+}
+
+
+def _iter_docs(drive, max_results: Optional[int]) -> Iterator[dict]:
+    """Lazily yield Google Docs metadata, fetching pages only as consumed."""
+    limited = bool(max_results and max_results > 0)
+    page_size = min(1000, max_results) if limited else 1000
+    params = {**_LIST_DOCS_PARAMS, "pageSize": page_size}
+    while True:
+        resp = execute(drive.files().list(**params))
+        yield from resp.get("files", []) or []
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+        params["pageToken"] = page_token
+
+
+def _fetch_docs(drive, max_results: Optional[int]) -> List[dict]:
+    """Return raw metadata for at most max_results Google Docs (all if <= 0)."""
+    limit = max_results if max_results and max_results > 0 else None
+    # islice stops the generator at exactly `limit` items, so no extra page is requested.
+    files = list(itertools.islice(_iter_docs(drive, max_results), limit))
+    with _META_LOCK:
+        for f in files:
+            _META_CACHE[f["id"]] = f
+    return files
+
+
+def list_docs(max_results: Optional[int] = None, refresh: bool = False) -> List[str]:
     """
     List Google Docs files accessible to the user.
 
@@ -63,41 +118,24 @@ def list_docs(max_results: Optional[int] = None) -> List[str]:
     rather than limiting to a fixed number of results.  If
     ``max_results`` is provided and positive, at most that many
     documents are returned; otherwise, all documents are returned.
+    Results are cached on disk for a few minutes (see utils.drive_cache).
 
     Args:
         max_results: Optional maximum number of documents to return.  If
             ``None`` or <= 0, the function returns every document.
+        refresh: If True, bypass the cached listing and query Drive again.
 
     Returns:
         A list of formatted strings describing each document.
     """
     drive = get_drive_service()
     try:
-        files: List[dict] = []
-        page_token: str | None = None
-        while True:
-            page_size = 1000
-            if max_results and max_results > 0:
-                remaining = max_results - len(files)
-                if remaining <= 0:
-                    break
-                page_size = min(page_size, remaining)
-            params = {
-                "q": "mimeType='application/vnd.google-apps.document' and trashed=false",
-                "fields": "nextPageToken, files(id,name,modifiedTime,webViewLink)",
-                "orderBy": "modifiedTime desc",
-                "pageSize": page_size,
-                # Include documents from shared drives and shared resources
-                "supportsAllDrives": True,
-                "includeItemsFromAllDrives": True,
-            }
-            if page_token:
-                params["pageToken"] = page_token
-            resp = drive.files().list(**params).execute()
-            files.extend(resp.get("files", []) or [])
-            page_token = resp.get("nextPageToken")
-            if not page_token or (max_results and max_results > 0 and len(files) >= max_results):
-                break
+        files = drive_cache.cached(
+            "list_docs",
+            {"max_results": max_results},
+            lambda: _fetch_docs(drive, max_results),
+            refresh=refresh,
+        )
         if not files:
             return ["No Google Docs found."]
         return [
@@ -108,31 +146,63 @@ def list_docs(max_results: Optional[int] = None) -> List[str]:
         raise ValueError(f"Failed to list Google Docs: {str(e)}")
 
 
+def _render_doc(document_id: str, doc: dict) -> str:
+    """Format a Docs API document resource as plain text."""
+    title = doc.get("title", "Untitled Document")
+    body = doc.get("body", {}).get("content", [])
+    buf = io.StringIO()
+    buf.write(f"Document: {title} (ID: {document_id})\n{'-' * 40}\n")
+    # Text runs already carry their own paragraph newlines, so write them
+    # through as-is instead of stripping and re-joining each one.
+    for el in body:
+        for e in el.get("paragraph", {}).get("elements", ()):
+            content = e.get("textRun", {}).get("content")
+            if content:
+                buf.write(content)
+    return buf.getvalue()
+
+
 def get_doc_content(document_id: str) -> str:
     """Retrieve plain text content of a Google Doc."""
     docs = get_docs_service()
     try:
-        doc = docs.documents().get(documentId=document_id).execute()
-        title = doc.get("title", "Untitled Document")
-        body = doc.get("body", {}).get("content", [])
-        lines = [f"Document: {title} (ID: {document_id})", "-" * 40]
-
-        for el in body:
-            if "paragraph" in el:
-                for e in el["paragraph"].get("elements", []):
-                    text_run = e.get("textRun", {})
-                    if "content" in text_run:
-                        lines.append(text_run["content"].strip())
-        return "\n".join(lines)
+        doc = execute(docs.documents().get(documentId=document_id, fields=DOC_TEXT_FIELDS))
+        return _render_doc(document_id, doc)
     except HttpError as e:
         raise ValueError(f"Failed to read document: {str(e)}")
 
 
+def get_many_doc_contents(document_ids: List[str]) -> List[str]:
+    """
+    Retrieve the plain text of several Google Docs concurrently.
+
+    Requests are fanned out over a small thread pool (each worker uses its
+    own HTTP connection), so N documents take roughly N/8 round trips
+    instead of N. Results are returned in the same order as the IDs.
+    """
+    docs = get_docs_service()
+
+    def _fetch(document_id: str) -> str:
+        http = get_thread_http(SCOPES, "DOCS")
+        try:
+            doc = execute(
+                docs.documents().get(documentId=document_id, fields=DOC_TEXT_FIELDS), http=http
+            )
+            return _render_doc(document_id, doc)
+        except HttpError as e:
+            return f"Failed to read document {document_id}: {e}"
+
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        return list(pool.map(_fetch, document_ids))
+
+
 def create_doc(title: str) -> str:
     """Create a new Google Doc and return its ID and link."""
     docs = get_docs_service()
     try:
-        doc = docs.documents().create(body={"title": title}).execute()
+        doc = execute(docs.documents().create(body={"title": title}, fields="documentId"))
+        # The new doc must show up in the next list_docs call.
+        drive_cache.invalidate("list_docs")
         doc_id = doc.get("documentId")
         url = f"https://docs.google.com/document/d/{doc_id}/edit"
         return f"Created new doc '{title}'. ID: {doc_id} | URL: {url}"
@@ -140,47 +210,77 @@ def create_doc(title: str) -> str:
         raise ValueError(f"Failed to create document: {str(e)}")
 
 
+def _append_request(text: str) -> dict:
+    # endOfSegmentLocation targets the end of the body without the caller
+    # (or the server) having to know the document's length.
+    return {"insertText": {"endOfSegmentLocation": {"segmentId": ""}, "text": f"\n{text}\n"}}
+
+
 def append_doc_text(document_id: str, text: str) -> str:
     """Append text to the end of a Google Doc."""
     docs = get_docs_service()
     try:
-        requests = [{"insertText": {"location": {"index": 1_000_000}, "text": f"\n{text}\n"}}]
-        docs.documents().batchUpdate(documentId=document_id, body={"requests": requests}).execute()
+        requests = [_append_request(text)]
+        execute(docs.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}, fields="documentId"
+        ))
         return f"Appended text to document {document_id}."
     except HttpError as e:
         raise ValueError(f"Failed to append text: {str(e)}")
 
 
+def append_doc_texts(document_id: str, texts: List[str]) -> str:
+    """Append several blocks of text to the end of a Google Doc in one request."""
+    if not texts:
+        return f"No text to append to document {document_id}."
+    docs = get_docs_service()
+    try:
+        requests = [_append_request(text) for text in texts]
+        execute(docs.documents().batchUpdate(
+            documentId=document_id, body={"requests": requests}, fields="documentId"
+        ))
+        return f"Appended {len(texts)} text blocks to document {document_id}."
+    except HttpError as e:
+        raise ValueError(f"Failed to append text: {str(e)}")
+
+
 def get_doc_modified_time(document_id: str) -> dict:
     """
     Retrieve the last modified time of a Google Doc in structured form.
+
+    Metadata seen by list_docs (or a previous call) within the last
+    META_TTL seconds is reused instead of asking Drive again.
     """
-    drive = get_drive_service()
     try:
-        file_metadata = drive.files().get(
-            fileId=document_id,
-            fields="name, modifiedTime, webViewLink",
-        ).execute()
+        with _META_LOCK:
+            file_metadata = _META_CACHE.get(document_id)
+        if file_metadata is None:
+            drive = get_drive_service()
+            file_metadata = execute(drive.files().get(
+                fileId=document_id,
+                fields="name, modifiedTime, webViewLink",
+            ))
+            with _META_LOCK:
+                _META_CACHE[document_id] = file_metadata
 
         modified_str = file_metadata.get("modifiedTime")
         if not modified_str:
             raise ValueError("No modifiedTime found in file metadata.")
 
-        modified_dt = datetime.fromisoformat(modified_str.replace("Z", "+00:00"))
-        local_tz = get_localzone()
+        modified_dt = datetime.fromisoformat(modified_str)
+        local_tz = local_timezone()
         modified_local = modified_dt.astimezone(local_tz)
+        date, time_str, weekday, summary = modified_local.strftime(MODIFIED_TIME_FORMAT).split("\x1f")
 
         return {
             "document_id": document_id,
             "document_name": file_metadata.get("name", "(untitled)"),
             "datetime": modified_local.isoformat(),
-            "date": modified_local.strftime("%Y-%m-%d"),
-            "time": modified_local.strftime("%H:%M:%S"),
-            "weekday": modified_local.strftime("%A"),
+            "date": date,
+            "time": time_str,
+            "weekday": weekday,
             "timezone": str(local_tz),
-            "summary": modified_local.strftime(
-                f"Last modified on %A, %b %d %Y at %I:%M %p %Z"
-            ),
+            "summary": summary,
             "link": file_metadata.get("webViewLink"),
         }
     except HttpError as e:
@@ -194,10 +294,11 @@ def make_time_context(preferred_tz: Optional[str] = None) -> dict:
     """
     Return structured current time context.
 
-    This wrapper calls utils.time_utils.get_time_context to obtain a base
-    dictionary containing date/time components. It then adds a human-readable
-    summary and returns the enhanced context. By reusing get_time_context,
-    we ensure consistent timezone handling across all agents.
+    This wrapper calls utils.time_utils.get_time_context_raw to obtain a base
+    dictionary containing date/time components, along with the datetime it
+    was built from. It then adds a human-readable summary and returns the
+    enhanced context. By reusing the shared time helpers, we ensure
+    consistent timezone handling across all agents.
 
     Args:
         preferred_tz: Optional IANA timezone string. If provided, the
@@ -208,15 +309,9 @@ def make_time_context(preferred_tz: Optional[str] = None) -> dict:
         A dictionary containing ISO timestamp, date, time, weekday,
         timezone, UTC offset, and a formatted summary string.
     """
-    ctx = get_time_context(preferred_tz)
+    dt, ctx = get_time_context_raw(preferred_tz)
     # Compute a summary in the format "Weekday, Month Day Year, HH:MM AM TZ".
-    try:
-        dt = datetime.fromisoformat(ctx["datetime"])
-        summary = dt.strftime("%A, %b %d %Y, %I:%M %p %Z")
-    except Exception:
-        # Fallback: build summary from individual context fields
-        summary = f"{ctx.get('weekday', '')}, {ctx.get('date', '')} {ctx.get('time', '')} {ctx.get('timezone', '')}"
-    ctx["summary"] = summary
+    ctx["summary"] = dt.strftime("%A, %b %d %Y, %I:%M %p %Z")
     return ctx
 
 
@@ -226,9 +321,9 @@ def make_time_context(preferred_tz: Optional[str] = None) -> dict:
 docs_agent_instruction_text = """
 You are a specialized Google Docs assistant. You can:
 - List or search Google Docs
-- Retrieve document text
+- Retrieve document text (use get_many_doc_contents to read several documents at once)
 - Create new documents
-- Append or write text
+- Append or write text (use append_doc_texts to add several blocks in one call)
 - Get document modification times
 
 Rules:
@@ -249,8 +344,10 @@ google_docs_agent: Agent  = Agent(
         tools=[
             list_docs,
             get_doc_content,
+            get_many_doc_contents,
             create_doc,
             append_doc_text,
+            append_doc_texts,
             make_time_context,
             get_doc_modified_time,
         ],
@@ -12,19 +12,26 @@ It can:
 
 import os
 import io
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple
 
-from tzlocal import get_localzone
-from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload, MediaUpload
 from googleapiclient.errors import HttpError
 
 from google.adk.agents import Agent
 from google.genai import types
 
 import httpx
+from cachetools import TTLCache
 
-from utils.google_service_helpers import get_google_service
+from utils.google_service_helpers import batch_get_files, get_bundle, get_thread_http
+from utils.time_utils import MODIFIED_TIME_FORMAT, local_timezone
+from utils import drive_cache, pdf_text
+from utils.rate_limit import execute
 
 MODEL = os.environ.get("MODEL", "gemini-2.5-flash")
 
@@ -34,91 +41,386 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.file",
 ]
 
+# Concurrent folder listings per BFS level in list_drive_files_recursive.
+MAX_LIST_WORKERS = 10
+
+# Concurrent downloads in get_drive_files_content_bulk (and metadata lookups
+# overlapped with downloads in _read_file_content).
+MAX_DOWNLOAD_WORKERS = 8
+
+# Resumable upload chunk size for URL uploads (must be a multiple of 256 KB).
+UPLOAD_CHUNKSIZE = 8 * 1024 * 1024
+
+# Shared HTTP client for URL downloads; reusing it keeps TLS sessions and
+# keep-alive connections warm across upload_drive_file_from_url calls.
+_HTTPX = httpx.Client(
+    follow_redirects=True,
+    timeout=httpx.Timeout(30.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+)
+
 # ------------------------------------------
 # Auth Bootstrap
 # ------------------------------------------
 def get_drive_service() -> object:
-    """Return an authenticated Google Drive service."""
-    return get_google_service("drive", "v3", SCOPES, "DRIVE")
+    """Return an authenticated Google Drive service.
+
+    Built from the same ServiceBundle as get_thread_http(SCOPES, "DRIVE"), so
+    threaded downloads reuse the service's per-thread connections.
+    """
+    return get_bundle(SCOPES, "DRIVE").drive
 
 # ------------------------------------------
 # Internal helpers
 # ------------------------------------------
-def _paginate_files(drive, q: str, page_size: int = 1000) -> List[Dict]:
-    """Fetch ALL matching files across all drives."""
-    items: List[Dict] = []
-    page_token = None
+_FILE_LIST_FIELDS = "nextPageToken, files(id,name,mimeType,modifiedTime,webViewLink,parents)"
+
+def _iter_files(
+    drive,
+    q: str,
+    page_size: int = 1000,
+    http=None,
+    *,
+    fields: str = _FILE_LIST_FIELDS,
+    order_by: str = "modifiedTime desc",
+    parent_scoped: bool = False,
+) -> Iterator[Dict]:
+    """Lazily yield matching files across all drives (on ``http`` if given).
+
+    Pages are requested only as the consumer advances, so a caller that stops
+    early never fetches the remaining pages. An empty order_by omits orderBy,
+    sparing Drive a server-side sort. parent_scoped=True (q restricts to one
+    parent folder) drops corpora=allDrives so Drive can answer from the
+    parent's index instead of planning a cross-drive query.
+    """
+    params = {
+        "q": q,
+        "fields": fields,
+        "supportsAllDrives": True,
+        "includeItemsFromAllDrives": True,
+        "pageSize": page_size,
+    }
+    if not parent_scoped:
+        params["corpora"] = "allDrives"   # <-- key to see everything you can access
+    if order_by:
+        params["orderBy"] = order_by
     while True:
-        params = {
-            "q": q,
-            "fields": "nextPageToken, files(id,name,mimeType,modifiedTime,webViewLink,parents)",
-            "supportsAllDrives": True,
-            "includeItemsFromAllDrives": True,
-            "pageSize": page_size,
-            "orderBy": "modifiedTime desc",
-            "corpora": "allDrives",   # <-- key to see everything you can access
-        }
-        if page_token:
-            params["pageToken"] = page_token
-        resp = drive.files().list(**params).execute()
-        items.extend(resp.get("files", []) or [])
+        resp = execute(drive.files().list(**params), http=http)
+        yield from resp.get("files", []) or []
         page_token = resp.get("nextPageToken")
         if not page_token:
             break
+        params["pageToken"] = page_token
+
+def _paginate_files(drive, q: str, page_size: int = 1000, http=None, *, limit: int = 0, **kwargs) -> List[Dict]:
+    """Collect _iter_files into a list; limit > 0 stops after that many files."""
+    if limit > 0:
+        return list(itertools.islice(_iter_files(drive, q, min(page_size, limit), http, **kwargs), limit))
+    return list(_iter_files(drive, q, page_size, http, **kwargs))
+
+# In-process memo of folder listings and file metadata, so repeat queries
+# within a session (e.g. re-walking a resume folder) skip the round trip.
+MEMO_TTL = 60.0
+_LISTINGS: TTLCache = TTLCache(maxsize=256, ttl=MEMO_TTL)
+_METADATA: TTLCache = TTLCache(maxsize=4096, ttl=MEMO_TTL)
+_MEMO_LOCK = threading.Lock()
+
+# Rendered PDF-folder listings: resume scoring is typically re-run against the
+# same folder with different skill lists, so these live longer (5 minutes).
+_PDF_LISTINGS: TTLCache = TTLCache(maxsize=64, ttl=300)
+
+def _list_files(drive, q: str, http=None, **options) -> List[Dict]:
+    """_paginate_files, memoized per query and options for MEMO_TTL seconds."""
+    key = (q, tuple(sorted(options.items())))
+    with _MEMO_LOCK:
+        hit = _LISTINGS.get(key)
+    if hit is not None:
+        return hit
+    items = _paginate_files(drive, q, http=http, **options)
+    with _MEMO_LOCK:
+        _LISTINGS[key] = items
     return items
 
+def _batch_get_memoized(drive, file_ids: List[str], fields: str, **kwargs) -> Dict[str, object]:
+    """batch_get_files, serving fresh memoized metadata without a request."""
+    found: Dict[str, object] = {}
+    with _MEMO_LOCK:
+        for fid in file_ids:
+            hit = _METADATA.get((fid, fields))
+            if hit is not None:
+                found[fid] = hit
+    missing = [fid for fid in file_ids if fid not in found]
+    if missing:
+        fetched = batch_get_files(drive, missing, fields, **kwargs)
+        with _MEMO_LOCK:
+            for fid, meta in fetched.items():
+                if not isinstance(meta, Exception):
+                    _METADATA[(fid, fields)] = meta
+        found.update(fetched)
+    return found
+
+def invalidate_drive_cache(folder_id: str = "") -> str:
+    """
+    Drop memoized Drive listings and metadata so the next call refetches.
+      - folder_id: "" clears everything; otherwise only listings of that folder.
+    The next global listing also re-syncs the local index from the change feed.
+    """
+    global _index_synced
+    _index_synced = 0.0
+    with _MEMO_LOCK:
+        if folder_id:
+            needle = f"'{folder_id}' in parents"
+            for key in [key for key in _LISTINGS if needle in key[0]]:
+                del _LISTINGS[key]
+            for key in [key for key in _PDF_LISTINGS if key[0] == folder_id]:
+                del _PDF_LISTINGS[key]
+        else:
+            _LISTINGS.clear()
+            _METADATA.clear()
+            _PDF_LISTINGS.clear()
+    return f"Cleared cached Drive listings{' for folder ' + folder_id if folder_id else ''}."
+
+_CHANGE_FIELDS = (
+    "nextPageToken, newStartPageToken, "
+    "changes(fileId, removed, file(id,name,mimeType,modifiedTime,webViewLink,parents,trashed))"
+)
+
+# Listings within this many seconds of the last change-feed sync are served
+# from the index without a changes.list round trip.
+INDEX_SYNC_INTERVAL = 60.0
+# After a failed background seed, wait this long before crawling Drive again.
+INDEX_SEED_RETRY = 600.0
+_INDEX_LOCK = threading.Lock()
+_index_synced = 0.0
+_index_seeding = False
+_index_seed_failed = float("-inf")
+_index_unavailable = False
+
+def _seed_index(drive) -> bool:
+    """Page the full listing into the index; False if it could not be stored."""
+    global _index_synced, _index_unavailable
+    # Take the token before listing so changes made mid-listing are replayed.
+    start = execute(drive.changes().getStartPageToken(supportsAllDrives=True))
+    files = _paginate_files(drive, "trashed=false")
+    if not drive_cache.index_seed(files, start["startPageToken"]):
+        _index_unavailable = True
+        return False
+    _index_synced = time.monotonic()
+    return True
+
+def _seed_index_in_background() -> None:
+    """Start one background seed of the index unless one is already running.
+
+    A failed seed is not retried for INDEX_SEED_RETRY seconds, so a persistent
+    error doesn't turn every global listing into another full-Drive crawl.
+    """
+    global _index_seeding
+
+    def _run():
+        global _index_seeding, _index_seed_failed
+        failed = False
+        try:
+            # Built on this thread, so the listing runs on its own transport.
+            _seed_index(get_drive_service())
+        except Exception:
+            failed = True
+        finally:
+            with _INDEX_LOCK:
+                _index_seeding = False
+                if failed:
+                    _index_seed_failed = time.monotonic()
+
+    with _INDEX_LOCK:
+        if _index_seeding or time.monotonic() - _index_seed_failed < INDEX_SEED_RETRY:
+            return
+        _index_seeding = True
+    threading.Thread(target=_run, name="drive-index-seed", daemon=True).start()
+
+def _ensure_index(drive, refresh: bool = False) -> bool:
+    """
+    Bring the local Drive index (utils.drive_cache) up to date, if it exists.
+
+    The first call only starts seeding the index in the background (one full
+    listing) and returns False, so the caller answers with a direct files.list
+    instead of waiting for the whole Drive. refresh=True reseeds synchronously.
+    Once seeded, a sync walks changes.list from the stored token, costing
+    O(changes), and runs at most once per INDEX_SYNC_INTERVAL.
+    Returns False if the index is not ready or unavailable (e.g. read-only
+    filesystem), or if Drive rejected the sync; a rejected stored token is
+    dropped so the index reseeds.
+    """
+    global _index_synced
+    try:
+        if refresh:
+            return _seed_index(drive)
+        if _index_unavailable:
+            return False
+        token = drive_cache.index_token()
+        if token is None:
+            _seed_index_in_background()
+            return False
+        if time.monotonic() - _index_synced < INDEX_SYNC_INTERVAL:
+            return True
+
+        while token:
+            resp = execute(drive.changes().list(
+                pageToken=token,
+                fields=_CHANGE_FIELDS,
+                pageSize=1000,
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True,
+            ))
+            new_start = resp.get("newStartPageToken")
+            next_token = resp.get("nextPageToken")
+            drive_cache.index_apply(resp.get("changes", []) or [], next_token or new_start)
+            token = next_token
+    except HttpError:
+        drive_cache.index_reset()
+        return False
+    _index_synced = time.monotonic()
+    return True
+
+class _StreamingUpload(MediaUpload):
+    """
+    Resumable upload fed from an iterator of byte chunks of unknown total size.
+
+    googleapiclient's MediaIoBaseUpload seeks to the end of its file object to
+    learn the size, so it needs the whole payload up front. This upload hands
+    out bytes sequentially, keeping only about one chunk buffered (so it can be
+    re-sent if the server acknowledges less), and reports size() as None until
+    the source runs dry.
+    """
+
+    def __init__(self, pieces: Iterator[bytes], mimetype: str, chunksize: int = UPLOAD_CHUNKSIZE):
+        super().__init__()
+        self._pieces = pieces
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+        self._buf = bytearray()
+        self._buf_start = 0  # stream offset of self._buf[0]
+        self._served_end = 0  # stream offset just past the last getbytes()
+        self._total = None  # total size, once the source is exhausted
+
+    def _fill(self, end: int) -> None:
+        """Buffer the source up to stream offset `end`, or to EOF (recording the total)."""
+        while self._total is None and self._buf_start + len(self._buf) < end:
+            piece = next(self._pieces, None)
+            if piece is None:
+                self._total = self._buf_start + len(self._buf)
+            else:
+                self._buf += piece
+
+    def chunksize(self):
+        return self._chunksize
+
+    def mimetype(self):
+        return self._mimetype
+
+    def size(self):
+        # next_chunk() reads size() before fetching each chunk. Buffering one
+        # byte past that chunk reveals EOF before the last full chunk is sent,
+        # so it goes out as "bytes P-Q/total". Otherwise a payload that is an
+        # exact multiple of chunksize would end with an empty read, which
+        # googleapiclient sends as the invalid range "bytes P-(P-1)/P".
+        self._fill(self._served_end + self._chunksize + 1)
+        return self._total
+
+    def resumable(self):
+        return True
+
+    def has_stream(self):
+        return False
+
+    def getbytes(self, begin, length):
+        # Everything before `begin` has been committed by the server.
+        if begin > self._buf_start:
+            del self._buf[: begin - self._buf_start]
+            self._buf_start = begin
+        self._fill(begin + length)
+        data = bytes(self._buf[:length])
+        self._served_end = begin + len(data)
+        return data
+
 # ------------------------------------------
 # Tools (AFC-friendly: no unions/Optionals)
 # ------------------------------------------
-def list_drive_files(max_results: int = 0, folder_id: str = "", mime_type: str = "") -> List[str]:
+def _format_rows(items: List[Dict]) -> str:
+    """Render file metadata as one newline-separated block (one row per file)."""
+    return "\n".join(
+        f"{f.get('name','(untitled)')} — ID: {f['id']} — Type: {f['mimeType']} — "
+        f"Modified: {f.get('modifiedTime','?')} — Link: {f.get('webViewLink','-')}"
+        for f in items
+    )
+
+
+def list_drive_files(
+    max_results: int = 0, folder_id: str = "", mime_type: str = "", refresh: bool = False
+) -> str:
     """
     List files/folders across all drives. If folder_id is provided, list direct
     children of that folder. If mime_type is provided, filter by that type.
       - max_results: 0 means unlimited.
       - folder_id: "" means search globally.
       - mime_type: "" means any type; e.g. 'application/vnd.google-apps.folder' for folders.
+      - refresh: True skips cached results (and, for global listings,
+        rebuilds the local Drive index from a full listing).
     """
     drive = get_drive_service()
     try:
-        q_parts = ["trashed=false"]
-        if folder_id:
-            q_parts.append(f"'{folder_id}' in parents")
-        if mime_type:
-            q_parts.append(f"mimeType='{mime_type}'")
-        items = _paginate_files(drive, " and ".join(q_parts))
-
-        if max_results > 0:
-            items = items[:max_results]
+        # The local index only pays off for global listings; a folder listing
+        # is a single parent-scoped files.list.
+        items = None
+        if not folder_id and _ensure_index(drive, refresh=refresh):
+            items = drive_cache.index_query("", mime_type, limit=max_results)
+        if items is None:
+            if refresh:
+                invalidate_drive_cache(folder_id)
+            folder_clause = f" and '{folder_id}' in parents" if folder_id else ""
+            type_clause = f" and mimeType='{mime_type}'" if mime_type else ""
+            items = _list_files(
+                drive,
+                f"trashed=false{folder_clause}{type_clause}",
+                limit=max_results,
+                parent_scoped=bool(folder_id),
+            )
 
         if not items:
-            return ["No files found in Drive."]
-        return [
-            f"{f.get('name','(untitled)')} — ID: {f['id']} — Type: {f['mimeType']} — "
-            f"Modified: {f.get('modifiedTime','?')} — Link: {f.get('webViewLink','-')}"
-            for f in items
-        ]
+            return "No files found in Drive."
+        return _format_rows(items)
     except HttpError as e:
         raise ValueError(f"Failed to list Drive files: {e}")
-def list_drive_pdfs_in_folder(folder_id: str, max_results: int = 0) -> List[str]:
+def list_drive_pdfs_in_folder(folder_id: str, max_results: int = 0) -> str:
     """
     List PDF files inside a specific folder.
       - folder_id: ID of the folder to search in.
       - max_results: 0 means unlimited.
     """
     if not folder_id:
-        return ["folder_id is required."]
-    return list_drive_files(
+        return "folder_id is required."
+    key = (folder_id, max_results)
+    with _MEMO_LOCK:
+        hit = _PDF_LISTINGS.get(key)
+    if hit is not None:
+        return hit
+    listing = list_drive_files(
         max_results=max_results,
         folder_id=folder_id,
         mime_type="application/pdf"
     )
+    with _MEMO_LOCK:
+        _PDF_LISTINGS[key] = listing
+    return listing
 
-def list_drive_folders(max_results: int = 0, folder_id: str = "") -> List[str]:
+def list_drive_folders(max_results: int = 0, folder_id: str = "") -> str:
     """List folders (optionally inside a specific parent folder)."""
     folder_mime = "application/vnd.google-apps.folder"
     return list_drive_files(max_results=max_results, folder_id=folder_id, mime_type=folder_mime)
 
-def list_drive_files_recursive(start_folder_id: str, max_results: int = 0, mime_type: str = "") -> List[str]:
+# The traversal only needs what it prints plus mimeType to find subfolders,
+# and it keeps BFS order, so parents and server-side sorting are skipped.
+_TRAVERSAL_FIELDS = "nextPageToken, files(id,mimeType,name,modifiedTime,webViewLink)"
+
+def list_drive_files_recursive(start_folder_id: str, max_results: int = 0, mime_type: str = "") -> str:
     """
     Recursively traverse folders starting at start_folder_id and list all matching items.
       - start_folder_id: required
@@ -126,128 +428,196 @@ def list_drive_files_recursive(start_folder_id: str, max_results: int = 0, mime_
       - mime_type: "" = any; e.g., folder mime to list only folders
     """
     if not start_folder_id:
-        return ["start_folder_id is required."]
+        return "start_folder_id is required."
 
     drive = get_drive_service()
     try:
         results: List[Dict] = []
-        queue: List[str] = [start_folder_id]
+        level: List[str] = [start_folder_id]
         folder_mime = "application/vnd.google-apps.folder"
+        type_filter = f" and mimeType='{mime_type}'" if mime_type else ""
+
+        def _children(parent: str, limit: int) -> List[Dict]:
+            # httplib2 is not thread-safe: each worker lists on its own transport.
+            http = get_thread_http(SCOPES, "DRIVE")
+            return _list_files(
+                drive,
+                f"'{parent}' in parents and trashed=false{type_filter}",
+                http=http,
+                fields=_TRAVERSAL_FIELDS,
+                order_by="",
+                limit=limit,
+                parent_scoped=True,
+            )
 
-        while queue:
-            parent = queue.pop(0)
-            q_parts = [f"'{parent}' in parents", "trashed=false"]
-            if mime_type:
-                q_parts.append(f"mimeType='{mime_type}'")
-            children = _paginate_files(drive, " and ".join(q_parts))
-            results.extend(children)
-
-            # Always discover subfolders to recurse deeper
-            subfolders = [c for c in children if c.get("mimeType") == folder_mime]
-            queue.extend([sf["id"] for sf in subfolders])
-
-            if max_results > 0 and len(results) >= max_results:
-                results = results[:max_results]
-                break
+        # Breadth-first, one level at a time: sibling folders are listed in
+        # parallel, and pool.map keeps the same order a serial BFS would produce.
+        with ThreadPoolExecutor(max_workers=MAX_LIST_WORKERS) as pool:
+            while level:
+                # No single folder can contribute more than the remaining
+                # budget, so stop paging each one there (0 = unlimited).
+                remaining = max_results - len(results) if max_results > 0 else 0
+                next_level: List[str] = []
+                for children in pool.map(_children, level, itertools.repeat(remaining)):
+                    results.extend(children)
+                    # Always discover subfolders to recurse deeper
+                    next_level.extend(c["id"] for c in children if c.get("mimeType") == folder_mime)
+                level = next_level
+
+                if max_results > 0 and len(results) >= max_results:
+                    results = results[:max_results]
+                    break
 
         if not results:
-            return [f"No items found under folder {start_folder_id}."]
-        return [
-            f"{f.get('name','(untitled)')} — ID: {f['id']} — Type: {f['mimeType']} — "
-            f"Modified: {f.get('modifiedTime','?')} — Link: {f.get('webViewLink','-')}"
-            for f in results
-        ]
+            return f"No items found under folder {start_folder_id}."
+        return _format_rows(results)
     except HttpError as e:
         raise ValueError(f"Failed to recursively list Drive files: {e}")
 
-def find_drive_items_by_name(name: str, exact: bool = True, mime_type: str = "", in_folder_id: str = "") -> List[str]:
+def find_drive_items_by_name(name: str, exact: bool = True, mime_type: str = "", in_folder_id: str = "") -> str:
     """
     Search by name (exact or contains). Optionally filter by mime_type or restrict to a folder.
       - exact=True uses name = '...'
       - exact=False uses name contains '...'
     """
     if not name:
-        return ["name is required."]
+        return "name is required."
 
     drive = get_drive_service()
     try:
-        q_parts = ["trashed=false"]
-        if in_folder_id:
-            q_parts.append(f"'{in_folder_id}' in parents")
-        if mime_type:
-            q_parts.append(f"mimeType='{mime_type}'")
-        if exact:
-            q_parts.append(f"name = '{name}'")
-        else:
-            q_parts.append(f"name contains '{name}'")
-
-        items = _paginate_files(drive, " and ".join(q_parts))
+        folder_clause = f" and '{in_folder_id}' in parents" if in_folder_id else ""
+        type_clause = f" and mimeType='{mime_type}'" if mime_type else ""
+        name_clause = f"name = '{name}'" if exact else f"name contains '{name}'"
+
+        items = _list_files(
+            drive,
+            f"trashed=false{folder_clause}{type_clause} and {name_clause}",
+            parent_scoped=bool(in_folder_id),
+        )
         if not items:
-            return [f"No items found matching name: {name}"]
-        return [
-            f"{f.get('name','(untitled)')} — ID: {f['id']} — Type: {f['mimeType']} — "
-            f"Modified: {f.get('modifiedTime','?')} — Link: {f.get('webViewLink','-')}"
-            for f in items
-        ]
+            return f"No items found matching name: {name}"
+        return _format_rows(items)
     except HttpError as e:
         raise ValueError(f"Failed to search by name: {e}")
 
-def get_drive_file_content(file_id: str) -> str:
-    """Download file content as text, if possible (handles Google Docs, Sheets, and PDFs)."""
-    drive = get_drive_service()
+_EXPORT_MAP = {
+    "application/vnd.google-apps.document": "text/plain",
+    "application/vnd.google-apps.spreadsheet": "text/csv",
+    "application/vnd.google-apps.presentation": "text/plain",
+}
+
+# Runs the metadata half of _read_file_content alongside its download.
+_META_POOL = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS)
+
+def _download(request, http=None) -> io.BytesIO:
+    """Run a media request to completion into memory."""
+    if http is not None:
+        request.http = http
+    fh = io.BytesIO()
+    downloader = MediaIoBaseDownload(fh, request)
+    done = False
+    while not done:
+        _, done = downloader.next_chunk()
+    return fh
+
+def _get_file_meta(drive, file_id: str) -> Dict:
+    """files.get for name/type, built and run on the calling (pool) thread's transport."""
+    request = drive.files().get(fileId=file_id, fields="name, mimeType")
+    return execute(request, http=get_thread_http(SCOPES, "DRIVE"))
+
+def _fetch_file(drive, file_id: str, http=None) -> Tuple[Dict, io.BytesIO]:
+    """Download one file; ``http`` overrides the service transport (per thread)."""
+    # 1) Fetch metadata while speculatively starting the raw download: the
+    #    download does not depend on name/type, so most files cost one round
+    #    trip instead of two. Google-native files reject get_media and are
+    #    exported once the type is known.
+    meta_future = _META_POOL.submit(_get_file_meta, drive, file_id)
     try:
-        meta = drive.files().get(
-            fileId=file_id,
-            fields="id, name, mimeType, webViewLink"
-        ).execute()
-        mime = meta["mimeType"]
-
-        export_map = {
-            "application/vnd.google-apps.document": "text/plain",
-            "application/vnd.google-apps.spreadsheet": "text/csv",
-            "application/vnd.google-apps.presentation": "text/plain",
-        }
-
-        # 1) Build request (export vs raw download)
-        if mime in export_map:
-            request = drive.files().export_media(fileId=file_id, mimeType=export_map[mime])
-        else:
-            request = drive.files().get_media(fileId=file_id)
-
-        # 2) Download into memory
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-        while not done:
-            _, done = downloader.next_chunk()
-
-        content = fh.getvalue()
-
-        # 3) Special handling for PDFs
-        if mime == "application/pdf":
+        fh, media_error = _download(drive.files().get_media(fileId=file_id), http), None
+    except HttpError as e:
+        fh, media_error = None, e
+    meta = meta_future.result()
+    mime = meta["mimeType"]
+
+    # 2) Export native Google files; otherwise keep the raw download
+    if mime in _EXPORT_MAP:
+        fh = _download(drive.files().export_media(fileId=file_id, mimeType=_EXPORT_MAP[mime]), http)
+    elif fh is None:
+        raise media_error
+    return meta, fh
+
+def _render_file(file_id: str, meta: Dict, fh: io.BytesIO, pdf_result=None) -> str:
+    """Format a downloaded file as text; pdf_result is pre-parsed PDF text or error."""
+    mime = meta["mimeType"]
+    # View the downloaded bytes in place; getvalue() would copy the whole file.
+    content = fh.getbuffer()
+    size = content.nbytes
+
+    # 3) Special handling for PDFs
+    if mime == "application/pdf":
+        if pdf_result is None:
             try:
-                import PyPDF2  # make sure PyPDF2 is installed
-                fh.seek(0)
-                reader = PyPDF2.PdfReader(fh)
-                pages = []
-                for page in reader.pages:
-                    pages.append(page.extract_text() or "")
-                text = "\n".join(pages).strip()
-                if not text:
-                    text = f"[Parsed PDF but no extractable text found — file may be scanned images. Size={len(content)} bytes]"
+                # PdfReader parses straight from the download buffer (no copy).
+                pdf_result = pdf_text.pdf_to_text(fh)
             except Exception as e:
-                text = f"[Unable to parse PDF text: {e}. Raw size={len(content)} bytes]"
+                pdf_result = e
+        if isinstance(pdf_result, Exception):
+            text = f"[Unable to parse PDF text: {pdf_result}. Raw size={size} bytes]"
+        elif not pdf_result:
+            text = f"[Parsed PDF but no extractable text found — file may be scanned images. Size={size} bytes]"
         else:
-            # 4) Default: assume it's text-ish
-            try:
-                text = content.decode("utf-8", errors="replace")
-            except Exception as e:
-                text = f"[Binary or unsupported text encoding — {len(content)} bytes; error={e}]"
+            text = pdf_result
+    else:
+        # 4) Default: assume it's text-ish
+        try:
+            text = str(content, "utf-8", errors="replace")
+        except Exception as e:
+            text = f"[Binary or unsupported text encoding — {size} bytes; error={e}]"
+    content.release()
+
+    return f"File: {meta['name']} (ID: {file_id}, Type: {mime})\n\n{text}"
 
-        return f"File: {meta['name']} (ID: {file_id}, Type: {mime})\n\n{text}"
+def get_drive_file_content(file_id: str) -> str:
+    """Download file content as text, if possible (handles Google Docs, Sheets, and PDFs)."""
+    drive = get_drive_service()
+    try:
+        meta, fh = _fetch_file(drive, file_id)
+        return _render_file(file_id, meta, fh)
     except HttpError as e:
         raise ValueError(f"Failed to read Drive file: {e}")
 
+def get_drive_files_content_bulk(file_ids: List[str]) -> List[str]:
+    """
+    Download several files as text concurrently (same output as get_drive_file_content).
+    Results come back in the same order as file_ids; a file that cannot be read
+    yields an error line instead of failing the whole call.
+    """
+    drive = get_drive_service()
+
+    def _fetch(file_id: str):
+        # httplib2 is not thread-safe: each worker downloads on its own transport.
+        http = get_thread_http(SCOPES, "DRIVE")
+        try:
+            return _fetch_file(drive, file_id, http=http)
+        except HttpError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as pool:
+        fetched = list(pool.map(_fetch, file_ids))
+
+    # PDF parsing is CPU-bound; parse all PDFs in parallel worker processes.
+    pdf_idx = [
+        i for i, f in enumerate(fetched)
+        if not isinstance(f, Exception) and f[0]["mimeType"] == "application/pdf"
+    ]
+    parsed = dict(zip(pdf_idx, pdf_text.extract_many([fetched[i][1].getvalue() for i in pdf_idx])))
+
+    return [
+        f"Failed to read Drive file {fid}: {f}" if isinstance(f, Exception)
+        else _render_file(fid, f[0], f[1], parsed.get(i))
+        for i, (fid, f) in enumerate(zip(file_ids, fetched))
+    ]
+
 def create_drive_file(file_name: str, content: str = "", folder_id: str = "root") -> str:
     """Create a text file in Google Drive."""
     drive = get_drive_service()
@@ -257,16 +627,15 @@ def create_drive_file(file_name: str, content: str = "", folder_id: str = "root"
         if content:
             media = MediaIoBaseUpload(io.BytesIO(content.encode("utf-8")), mimetype="text/plain")
 
-        file = (
-            drive.files()
-            .create(
+        file = execute(
+            drive.files().create(
                 body=metadata,
                 media_body=media,
                 fields="id, name, webViewLink",
                 supportsAllDrives=True,
             )
-            .execute()
         )
+        invalidate_drive_cache(folder_id)
         return f"Created '{file_name}' — ID: {file['id']} — Link: {file['webViewLink']}"
     except HttpError as e:
         raise ValueError(f"Failed to create Drive file: {e}")
@@ -275,86 +644,125 @@ def upload_drive_file_from_url(url: str, file_name: str, folder_id: str = "root"
     """Download a file from URL and upload to Google Drive."""
     drive = get_drive_service()
     try:
-        with httpx.Client(follow_redirects=True) as client:
-            resp = client.get(url)
+        metadata = {"name": file_name, "parents": [folder_id]}
+        # Stream the download straight into a resumable upload: each chunk is
+        # shipped as it arrives, so memory stays bounded to one chunk.
+        with _HTTPX.stream("GET", url) as resp:
             resp.raise_for_status()
-            data = resp.content
             mime = resp.headers.get("Content-Type", "application/octet-stream")
-
-        metadata = {"name": file_name, "parents": [folder_id]}
-        media = MediaIoBaseUpload(io.BytesIO(data), mimetype=mime, resumable=True)
-
-        file = (
-            drive.files()
-            .create(body=metadata, media_body=media, fields="id, name, webViewLink", supportsAllDrives=True)
-            .execute()
-        )
+            media = _StreamingUpload(resp.iter_bytes(65536), mimetype=mime)
+            request = drive.files().create(
+                body=metadata, media_body=media, fields="id, name, webViewLink", supportsAllDrives=True
+            )
+            file = None
+            while file is None:
+                _, file = request.next_chunk()
+        invalidate_drive_cache(folder_id)
         return f"Uploaded '{file_name}' from URL — ID: {file['id']} — Link: {file['webViewLink']}"
     except Exception as e:
         raise ValueError(f"Failed to upload file from URL: {e}")
 
-def get_drive_file_permissions(file_id: str) -> str:
-    """Check file permissions and sharing status."""
+def _get_file_metadata(drive, file_ids: List[str], fields: str, **kwargs) -> List[Dict]:
+    """Batch-fetch metadata for file_ids, in order; raise on the first failure."""
+    fetched = _batch_get_memoized(drive, file_ids, fields, **kwargs)
+    metas: List[Dict] = []
+    for fid in file_ids:
+        meta = fetched[fid]
+        if isinstance(meta, Exception):
+            raise meta
+        metas.append(meta)
+    return metas
+
+def _format_permissions(file_id: str, meta: Dict) -> str:
+    output = [
+        f"File: {meta['name']} (ID: {file_id})",
+        f"Shared: {meta.get('shared', False)}",
+        f"View Link: {meta.get('webViewLink', '-')}",
+        "",
+        "Permissions:",
+    ]
+    perms = meta.get("permissions", [])
+    if not perms:
+        output.append("  (Private file)")
+    else:
+        for p in perms:
+            typ = p.get("type")
+            role = p.get("role")
+            email = p.get("emailAddress", "")
+            output.append(f"  - {typ} ({role}) {email}")
+    return "\n".join(output)
+
+def _format_modified_time(file_id: str, meta: Dict) -> dict:
+    modified_str = meta.get("modifiedTime")
+    if not modified_str:
+        raise ValueError("No modifiedTime found for file.")
+
+    modified_dt = datetime.fromisoformat(modified_str)
+    local_tz = local_timezone()
+    modified_local = modified_dt.astimezone(local_tz)
+    date, time_str, weekday, summary = modified_local.strftime(MODIFIED_TIME_FORMAT).split("\x1f")
+
+    return {
+        "file_id": file_id,
+        "file_name": meta.get("name", "(untitled)"),
+        "mime_type": meta.get("mimeType"),
+        "datetime": modified_local.isoformat(),
+        "date": date,
+        "time": time_str,
+        "weekday": weekday,
+        "timezone": str(local_tz),
+        "summary": summary,
+        "link": meta.get("webViewLink"),
+    }
+
+def get_drive_files_permissions(file_ids: List[str]) -> List[str]:
+    """Check permissions and sharing status for several files in one batched request."""
     drive = get_drive_service()
     try:
-        meta = drive.files().get(
-            fileId=file_id,
-            fields="id, name, webViewLink, shared, permissions",
+        metas = _get_file_metadata(
+            drive,
+            file_ids,
+            "name, webViewLink, shared, permissions(type,role,emailAddress)",
             supportsAllDrives=True,
-        ).execute()
-
-        output = [
-            f"File: {meta['name']} (ID: {file_id})",
-            f"Shared: {meta.get('shared', False)}",
-            f"View Link: {meta.get('webViewLink', '-')}",
-            "",
-            "Permissions:",
-        ]
-        perms = meta.get("permissions", [])
-        if not perms:
-            output.append("  (Private file)")
-        else:
-            for p in perms:
-                typ = p.get("type")
-                role = p.get("role")
-                email = p.get("emailAddress", "")
-                output.append(f"  - {typ} ({role}) {email}")
-        return "\n".join(output)
+        )
+        return [_format_permissions(fid, meta) for fid, meta in zip(file_ids, metas)]
     except HttpError as e:
         raise ValueError(f"Failed to get permissions: {e}")
 
-def get_drive_file_modified_time(file_id: str) -> dict:
-    """Retrieve structured last-modified timestamp of a Drive file."""
+def get_drive_file_permissions(file_id: str) -> str:
+    """Check file permissions and sharing status."""
+    return get_drive_files_permissions([file_id])[0]
+
+def get_drive_files_modified_times(file_ids: List[str]) -> List[dict]:
+    """Retrieve structured last-modified timestamps for several files in one batched request."""
     drive = get_drive_service()
     try:
-        meta = drive.files().get(
-            fileId=file_id,
-            fields="id, name, mimeType, modifiedTime, webViewLink",
-        ).execute()
-
-        modified_str = meta.get("modifiedTime")
-        if not modified_str:
-            raise ValueError("No modifiedTime found for file.")
-
-        modified_dt = datetime.fromisoformat(modified_str.replace("Z", "+00:00"))
-        local_tz = get_localzone()
-        modified_local = modified_dt.asctime if False else modified_dt.astimezone(local_tz)
-
-        return {
-            "file_id": file_id,
-            "file_name": meta.get("name", "(untitled)"),
-            "mime_type": meta.get("mimeType"),
-            "datetime": modified_local.isoformat(),
-            "date": modified_local.strftime("%Y-%m-%d"),
-            "time": modified_local.strftime("%H:%M:%S"),
-            "weekday": modified_local.strftime("%A"),
-            "timezone": str(local_tz),
-            "summary": modified_local.strftime("Last modified on %A, %b %d %Y at %I:%M %p %Z"),
-            "link": meta.get("webViewLink"),
-        }
+        metas = _get_file_metadata(drive, file_ids, "name, mimeType, modifiedTime, webViewLink")
+        return [_format_modified_time(fid, meta) for fid, meta in zip(file_ids, metas)]
     except HttpError as e:
         raise ValueError(f"Failed to retrieve modified time: {e}")
 
+def get_drive_file_modified_time(file_id: str) -> dict:
+    """Retrieve structured last-modified timestamp of a Drive file."""
+    return get_drive_files_modified_times([file_id])[0]
+
+def get_drive_files_metadata_bulk(
+    file_ids: List[str],
+    fields: str = "id,name,mimeType,modifiedTime,webViewLink,shared,permissions",
+) -> List[Dict]:
+    """
+    Fetch metadata for many files in batched requests (up to 100 files per HTTP call).
+      - file_ids: Drive file IDs; results come back in the same order.
+      - fields: Drive fields mask for each file.
+    A file that cannot be read yields {"id": ..., "error": ...} instead of failing the call.
+    """
+    drive = get_drive_service()
+    fetched = _batch_get_memoized(drive, file_ids, fields, supportsAllDrives=True)
+    return [
+        {"id": fid, "error": str(meta)} if isinstance(meta, Exception) else meta
+        for fid, meta in ((fid, fetched[fid]) for fid in file_ids)
+    ]
+
 # ------------------------------------------
 # Agent Definition
 # ------------------------------------------
@@ -365,14 +773,19 @@ You are a Google Drive assistant. You can:
 - Upload or create new files
 - Check sharing permissions
 - Retrieve modification times for Drive files
+  (use get_drive_files_modified_times / get_drive_files_permissions for several files at once)
+- Fetch metadata for many files in one call with get_drive_files_metadata_bulk
 - Recursively traverse a folder tree
 
 Special behavior for resumes and skill scoring:
 - If the user asks you to evaluate or score resumes in a specific folder against a list
   of skills, follow this pattern:
   1) Use `list_drive_pdfs_in_folder(folder_id=...)` (or `list_drive_files` with
-     mime_type='application/pdf') to get all PDF resumes in that folder.
-  2) For each resume, call `get_drive_file_content(file_id=...)` to read its text.
+     mime_type='application/pdf') to get all PDF resumes in that folder. If you need
+     more metadata about them, call `get_drive_files_metadata_bulk` once with all IDs
+     rather than per-file metadata tools.
+  2) Call `get_drive_files_content_bulk(file_ids=[...])` once with all resume IDs to
+     read their text (use `get_drive_file_content` only for a single file).
   3) Using your own reasoning (no extra tools), compare the resume content to the
      user-provided skill list.
   4) For each resume, compute a score from 0–100% and identify:
@@ -383,6 +796,10 @@ Rules:
 - Use file IDs from list_drive_files()/list_drive_pdfs_in_folder()/find_drive_items_by_name().
 - Never expose credentials.
 - Keep text responses concise.
+- Listings and metadata are cached for a minute; call invalidate_drive_cache if the user
+  says files changed outside this conversation.
+- Global list_drive_files calls read from a local index kept in sync with Drive's change
+  feed; pass refresh=True only if results look wrong and a full rebuild is needed.
 - If a query is ambiguous, list the closest matches and ask which one to use.
 
 ### JSON output for resume scoring
@@ -428,10 +845,15 @@ google_drive_agent: Agent = Agent(
         list_drive_files_recursive,
         find_drive_items_by_name,
         get_drive_file_content,
+        get_drive_files_content_bulk,
         create_drive_file,
         upload_drive_file_from_url,
         get_drive_file_permissions,
+        get_drive_files_permissions,
         get_drive_file_modified_time,
+        get_drive_files_modified_times,
+        get_drive_files_metadata_bulk,
+        invalidate_drive_cache,
     ],
 )
 
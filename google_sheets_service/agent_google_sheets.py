@@ -2,12 +2,16 @@
 
 import os
 import os.path
+import itertools
 import json
-from typing import List, Optional
+import threading
+from typing import Iterator, List, Optional, Union
 
+from cachetools import TTLCache
 from googleapiclient.errors import HttpError
 
-from utils.google_service_helpers import get_google_service
+from utils.google_service_helpers import SPREADSHEET_INFO_FIELDS, get_bundle
+from utils.rate_limit import execute
 
 from google.adk.agents import Agent
 from google.genai import types
@@ -28,78 +32,147 @@ SCOPES = [
 #
 # We rely on the centralized helper to build Google API services. The SCOPES
 # constant defined above specifies the scopes needed for both Sheets and the
-# Drive API calls used by this agent. When obtaining a Drive service for
-# listing spreadsheets, we pass these same scopes to get_google_service.
+# Drive API calls used by this agent. Both clients come from one memoized
+# ServiceBundle, so they are built once per process and share a single
+# Credentials object (token.json is read once, not per tool call).
 
 def get_sheets_service():
     """Return an authenticated Google Sheets service (never None)."""
-    return get_google_service("sheets", "v4", SCOPES, "SHEETS")
+    return get_bundle(SCOPES, "SHEETS").sheets
 
 
 def get_drive_service():
     """Return an authenticated Drive service for listing spreadsheets."""
-    return get_google_service("drive", "v3", SCOPES, "SHEETS/DRIVE")
+    return get_bundle(SCOPES, "SHEETS").drive
+
+# -------------------------------
+# In-process caches
+# -------------------------------
+# Agents re-inspect the same spreadsheet and re-list spreadsheets several times
+# per session. get_spreadsheet_info results (including "not found" errors, so
+# deleted IDs are not re-probed) are kept for 60s and dropped by the tools that
+# change a spreadsheet; listings are kept for 30s.
+_INFO_CACHE: TTLCache = TTLCache(maxsize=128, ttl=60)
+_LIST_CACHE: TTLCache = TTLCache(maxsize=16, ttl=30)
+_CACHE_LOCK = threading.Lock()
+
+
+def _invalidate(spreadsheet_id: str) -> None:
+    with _CACHE_LOCK:
+        _INFO_CACHE.pop(spreadsheet_id, None)
 
 # -------------------------------
 # Tools (keep input types simple to avoid anyOf)
 # -------------------------------
-from typing import List, Optional  # make sure this line exists
+_LIST_SPREADSHEETS_PARAMS = {
+    "q": "mimeType='application/vnd.google-apps.spreadsheet' and trashed=false",
+    "fields": "nextPageToken, files(id,name,modifiedTime,webViewLink)",
+    "supportsAllDrives": True,
+    "includeItemsFromAllDrives": True,
+}
+
+
+def _iter_spreadsheets(drive, max_results: Optional[int]) -> Iterator[dict]:
+    """Lazily yield spreadsheet metadata, fetching pages only as consumed."""
+    limited = bool(max_results and max_results > 0)
+    params = {**_LIST_SPREADSHEETS_PARAMS, "pageSize": min(1000, max_results) if limited else 1000}
+    while True:
+        resp = execute(drive.files().list(**params))
+        yield from resp.get("files", []) or []
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+        params["pageToken"] = page_token
+
 
 def list_spreadsheets(max_results: Optional[int] = None) -> List[str]:
     """
     List spreadsheets the user can access (Drive).
+    If max_results is positive, at most that many are returned (and no
+    further pages are requested); otherwise all spreadsheets are listed.
     """
+    limit = max_results if max_results and max_results > 0 else None
+    with _CACHE_LOCK:
+        hit = _LIST_CACHE.get(limit)
+    if hit is not None:
+        return list(hit)
+
     drive = get_drive_service()
     try:
-        files = []
-        page_token = None
-        while True:
-            params = {
-                "q": "mimeType='application/vnd.google-apps.spreadsheet'",
-                "pageSize": 1000,
-                "fields": "nextPageToken, files(id,name,modifiedTime,webViewLink)",
-                "supportsAllDrives": True,
-                "includeItemsFromAllDrives": True,
-            }
-            if page_token:
-                params["pageToken"] = page_token
-
-            resp = drive.files().list(**params).execute()
-            files.extend(resp.get("files", []))
-            page_token = resp.get("nextPageToken")
-            if not page_token:
-                break
-
-        if not files:
-            return ["No spreadsheets found."]
-        return [
-            f"{f['name']} — ID: {f['id']} — Modified: {f.get('modifiedTime','?')} — Link: {f.get('webViewLink','-')}"
-            for f in files
-        ]
+        files = list(itertools.islice(_iter_spreadsheets(drive, max_results), limit))
     except HttpError as e:
         raise ValueError(f"Failed to list spreadsheets: {e}")
 
+    if not files:
+        lines = ["No spreadsheets found."]
+    else:
+        lines = [
+            f"{f['name']} — ID: {f['id']} — Modified: {f.get('modifiedTime','?')} — Link: {f.get('webViewLink','-')}"
+            for f in files
+        ]
+    with _CACHE_LOCK:
+        _LIST_CACHE[limit] = lines
+    return list(lines)
 
 
 def get_spreadsheet_info(spreadsheet_id: str) -> str:
     """Get spreadsheet title and sheet list."""
+    with _CACHE_LOCK:
+        hit: Union[str, ValueError, None] = _INFO_CACHE.get(spreadsheet_id)
+    if isinstance(hit, ValueError):
+        raise ValueError(*hit.args)
+    if hit is not None:
+        return hit
+
+    sheets = get_sheets_service()
+    try:
+        spreadsheet = execute(sheets.spreadsheets().get(
+            spreadsheetId=spreadsheet_id, fields=SPREADSHEET_INFO_FIELDS
+        ))
+    except HttpError as e:
+        error = ValueError(f"Failed to get spreadsheet info: {str(e)}")
+        if e.resp.status == 404:
+            with _CACHE_LOCK:
+                _INFO_CACHE[spreadsheet_id] = error
+        raise error
+
+    title = spreadsheet.get("properties", {}).get("title", "Untitled")
+    raw_sheets = spreadsheet.get("sheets", []) or []
+    lines = [f'Spreadsheet: "{title}" (ID: {spreadsheet_id})', f"Sheets ({len(raw_sheets)}):"]
+    for s in raw_sheets:
+        props = s.get("properties", {}) or {}
+        name = props.get("title", "Sheet")
+        sid = props.get("sheetId", "?")
+        grid = props.get("gridProperties", {}) or {}
+        rows = grid.get("rowCount", "?")
+        cols = grid.get("columnCount", "?")
+        lines.append(f'  - "{name}" (ID: {sid}) | Size: {rows}x{cols}')
+    info = "\n".join(lines)
+    with _CACHE_LOCK:
+        _INFO_CACHE[spreadsheet_id] = info
+    return info
+
+
+def _format_rows(values: List[List[str]]) -> List[str]:
+    """Format rows as 'Row N: [...]', padded to the width of the first row."""
+    # Slicing one shared pad list avoids building a fresh [""] * n per row.
+    empty_pad = [""] * len(values[0])
+    return [f"Row {i:2d}: {row + empty_pad[len(row):]}" for i, row in enumerate(values, 1)]
+
+
+def read_sheet_values_raw(spreadsheet_id: str, range_name: str = "A1:Z1000") -> List[List[str]]:
+    """
+    Read a range and return the cell values as a 2D list, with no formatting.
+    Rows keep their natural length (trailing empty cells are omitted by the API).
+    """
     sheets = get_sheets_service()
     try:
-        spreadsheet = sheets.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-        title = spreadsheet.get("properties", {}).get("title", "Untitled")
-        raw_sheets = spreadsheet.get("sheets", []) or []
-        lines = [f'Spreadsheet: "{title}" (ID: {spreadsheet_id})', f"Sheets ({len(raw_sheets)}):"]
-        for s in raw_sheets:
-            props = s.get("properties", {}) or {}
-            name = props.get("title", "Sheet")
-            sid = props.get("sheetId", "?")
-            grid = props.get("gridProperties", {}) or {}
-            rows = grid.get("rowCount", "?")
-            cols = grid.get("columnCount", "?")
-            lines.append(f'  - "{name}" (ID: {sid}) | Size: {rows}x{cols}')
-        return "\n".join(lines)
+        result = execute(sheets.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range=range_name, fields="values"
+        ))
+        return result.get("values", []) or []
     except HttpError as e:
-        raise ValueError(f"Failed to get spreadsheet info: {str(e)}")
+        raise ValueError(f"Failed to read values: {str(e)}")
 
 
 def read_sheet_values(spreadsheet_id: str, range_name: str = "A1:Z1000") -> List[str]:
@@ -120,20 +193,48 @@ def read_sheet_values(spreadsheet_id: str, range_name: str = "A1:Z1000") -> List
     """
     sheets = get_sheets_service()
     try:
-        result = sheets.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id, range=range_name
-        ).execute()
+        result = execute(sheets.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id, range=range_name, fields="values"
+        ))
         values = result.get("values", []) or []
         if not values:
             return [f"No data found in range '{range_name}'."]
-        base_len = len(values[0])
+        return _format_rows(values)
+    except HttpError as e:
+        raise ValueError(f"Failed to read values: {str(e)}")
+
+
+def read_sheet_ranges(spreadsheet_id: str, ranges_json: str) -> List[str]:
+    """
+    Read several ranges in one request (values.batchGet).
+    Example ranges_json: "[\"Sheet1!A1:D10\",\"Sheet2!A1:B5\"]"
+
+    Returns one header line per range followed by its rows, formatted like
+    read_sheet_values.
+    """
+    try:
+        ranges = json.loads(ranges_json)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"'ranges_json' must be valid JSON: {e}")
+    if not isinstance(ranges, list) or any(not isinstance(r, str) for r in ranges):
+        raise ValueError("'ranges_json' must decode to a list of A1 ranges, e.g. [\"Sheet1!A1:D10\"]")
+
+    sheets = get_sheets_service()
+    try:
+        result = execute(sheets.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id, ranges=ranges, fields="valueRanges(range,values)"
+        ))
         lines: List[str] = []
-        for i, row in enumerate(values, 1):
-            padded = row + [""] * max(0, base_len - len(row))
-            lines.append(f"Row {i:2d}: {padded}")
+        for range_name, value_range in zip(ranges, result.get("valueRanges", []) or []):
+            values = value_range.get("values", []) or []
+            lines.append(f"Range '{value_range.get('range', range_name)}':")
+            if not values:
+                lines.append(f"No data found in range '{range_name}'.")
+                continue
+            lines.extend(_format_rows(values))
         return lines
     except HttpError as e:
-        raise ValueError(f"Failed to read values: {str(e)}")
+        raise ValueError(f"Failed to read ranges: {str(e)}")
 
 
 def write_sheet_values(
@@ -153,15 +254,18 @@ def write_sheet_values(
         except json.JSONDecodeError as e:
             raise ValueError(f"'values_json' must be valid JSON: {e}")
 
-        if not isinstance(data_2d, list) or any(not isinstance(r, list) for r in data_2d):
+        # Only the outer shape is checked here; the API rejects malformed rows.
+        if type(data_2d) is not list or (data_2d and type(data_2d[0]) is not list):
             raise ValueError("'values_json' must decode to a 2D list, e.g. [[...],[...]]")
 
-        result = sheets.spreadsheets().values().update(
-            spreadsheetId=spreadsheets_id if False else spreadsheet_id,  # keep linter quiet if you like
+        result = execute(sheets.spreadsheets().values().update(
+            spreadsheetId=spreadsheet_id,
             range=range_name,
             valueInputOption=value_input_option,
             body={"values": data_2d},
-        ).execute()
+            fields="updatedCells,updatedRows,updatedColumns,updatedRange",
+        ))
+        _invalidate(spreadsheet_id)
 
         return (
             f"Updated '{range_name}'. "
@@ -171,13 +275,58 @@ def write_sheet_values(
         raise ValueError(f"Failed to write values: {str(e)}")
 
 
+def batch_write_sheet_values(
+    spreadsheet_id: str,
+    data_json: str,
+    value_input_option: str = "USER_ENTERED",  # or "RAW"
+) -> str:
+    """
+    Write several ranges in one request (values.batchUpdate).
+    Example data_json: "[{\"range\":\"Sheet1!A1:B1\",\"values\":[[\"Task\",\"Done\"]]}]"
+    """
+    try:
+        data = json.loads(data_json)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"'data_json' must be valid JSON: {e}")
+    if not isinstance(data, list) or any(
+        not isinstance(d, dict)
+        or not isinstance(d.get("range"), str)
+        or not isinstance(d.get("values"), list)
+        or any(not isinstance(r, list) for r in d["values"])
+        for d in data
+    ):
+        raise ValueError(
+            "'data_json' must decode to a list of {\"range\": ..., \"values\": [[...],[...]]} objects"
+        )
+
+    sheets = get_sheets_service()
+    try:
+        result = execute(sheets.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={
+                "valueInputOption": value_input_option,
+                "data": [{"range": d["range"], "values": d["values"]} for d in data],
+            },
+            fields="totalUpdatedCells,totalUpdatedRows,totalUpdatedColumns",
+        ), idempotent=True)
+        _invalidate(spreadsheet_id)
+        return (
+            f"Updated {len(data)} ranges. "
+            f"Cells: {result.get('totalUpdatedCells', 0)}, Rows: {result.get('totalUpdatedRows', 0)}, "
+            f"Columns: {result.get('totalUpdatedColumns', 0)}."
+        )
+    except HttpError as e:
+        raise ValueError(f"Failed to write values: {str(e)}")
+
+
 def clear_sheet_values(spreadsheet_id: str, range_name: str) -> str:
     """Clear values in a range."""
     sheets = get_sheets_service()
     try:
-        result = sheets.spreadsheets().values().clear(
-            spreadsheetId=spreadsheet_id, range=range_name
-        ).execute()
+        result = execute(sheets.spreadsheets().values().clear(
+            spreadsheetId=spreadsheet_id, range=range_name, fields="clearedRange"
+        ), idempotent=True)
+        _invalidate(spreadsheet_id)
         cleared = result.get("clearedRange", range_name)
         return f"Cleared range '{cleared}'."
     except HttpError as e:
@@ -188,7 +337,11 @@ def create_spreadsheet(title: str) -> str:
     """Create a new spreadsheet. Returns ID and URL."""
     sheets = get_sheets_service()
     try:
-        resp = sheets.spreadsheets().create(body={"properties": {"title": title}}).execute()
+        resp = execute(sheets.spreadsheets().create(
+            body={"properties": {"title": title}}, fields="spreadsheetId,spreadsheetUrl"
+        ))
+        with _CACHE_LOCK:
+            _LIST_CACHE.clear()
         return f"Created spreadsheet '{title}'. ID: {resp.get('spreadsheetId')} | URL: {resp.get('spreadsheetUrl')}"
     except HttpError as e:
         raise ValueError(f"Failed to create spreadsheet: {str(e)}")
@@ -199,7 +352,10 @@ def create_sheet(spreadsheet_id: str, sheet_name: str) -> str:
     sheets = get_sheets_service()
     try:
         body = {"requests": [{"addSheet": {"properties": {"title": sheet_name}}}]}
-        resp = sheets.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
+        resp = execute(sheets.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=body, fields="replies(addSheet(properties(sheetId)))"
+        ))
+        _invalidate(spreadsheet_id)
         sid = resp["replies"][0]["addSheet"]["properties"]["sheetId"]
         return f"Created sheet '{sheet_name}' (ID: {sid})."
     except HttpError as e:
@@ -217,6 +373,8 @@ Rules:
 - Use A1 notation (e.g., 'Sheet1!A1:D10').
 - For writing, pass `values_json` as a JSON-encoded 2D array, e.g. "[[\"Task\",\"Done\"],[\"Migrate\",\"Yes\"]]".
 - 'USER_ENTERED' respects formulas/locale; 'RAW' writes literal values.
+- To read or write several ranges, use read_sheet_ranges / batch_write_sheet_values
+  (one request) instead of repeated read_sheet_values / write_sheet_values calls.
 - Confirm actions with affected range or created IDs/URLs.
 """.strip()
 
@@ -234,7 +392,10 @@ google_sheets_agent : Agent = Agent(
             list_spreadsheets,
             get_spreadsheet_info,
             read_sheet_values,
+            read_sheet_values_raw,
+            read_sheet_ranges,
             write_sheet_values,   # <-- uses values_json: str (no Union/Optional)
+            batch_write_sheet_values,
             clear_sheet_values,   # <-- separate clear tool
             create_spreadsheet,
             create_sheet,
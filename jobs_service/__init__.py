@@ -11,18 +11,10 @@ except Exception:
     # Fallback: assume jobs_service/ is under the project root
     ROOT = Path(__file__).resolve().parents[1]
 
-# Load .env from .creds / .cred / project root
+# Load .env from .creds / .cred / project root (once per process; dotenv is
+# optional, and without it env vars must be provided by the OS)
 try:
-    from dotenv import load_dotenv  # type: ignore
-
-    for _env_path in [
-        ROOT / ".creds" / ".env",
-        ROOT / ".cred" / ".env",
-        ROOT / ".env",
-    ]:
-        if _env_path.exists():
-            load_dotenv(_env_path)
-            break
+    from utils.routing import load_project_env
+    ENV_PATH = load_project_env(ROOT)
 except Exception:
-    # dotenv is optional; if missing, env vars must be provided by the OS
-    pass
+    ENV_PATH = None
@@ -18,11 +18,10 @@ except Exception:
     pass
 from google.genai import types
 
-import os
 from jobs_service.sub_agent.database_agent import database_agent
 from jobs_service.sub_agent.greenhouse_fetch_agent import greenhouse_fetch_agent
 from jobs_service.sub_agent.enrichment_agent import description_agent
-MODEL = os.environ.get("MODEL", "gemini-2.5-flash")
+from jobs_service.settings import MODEL
 
 # -------------------------------
 # Detailed workflow description
@@ -0,0 +1,15 @@
+# jobs_service/settings.py
+"""
+Environment-derived settings shared by the job search agents.
+
+Read once when jobs_service is first imported (after jobs_service/__init__.py
+has loaded .env), so every sub-agent sees the same values.
+"""
+import os
+
+# Model used by every agent in the pipeline (override via MODEL in .env).
+MODEL = os.environ.get("MODEL", "gemini-2.5-flash")
+
+# Explicit ID of the Job_Search_Database spreadsheet. Empty when unset, in
+# which case the agents look the sheet up by name in Drive.
+JOB_SEARCH_SPREADSHEET_ID = (os.environ.get("JOB_SEARCH_SPREADSHEET_ID") or "").strip()
@@ -1,16 +1,17 @@
 import os
 import json
+import functools
 from typing import List, Dict, Any, Optional
 
 from googleapiclient.errors import HttpError
+
 from google.adk.agents import Agent
 from google.genai import types
 
-from utils.google_service_helpers import get_google_service  # centralized auth
+from utils.google_service_helpers import SPREADSHEET_INFO_FIELDS, get_bundle  # centralized auth
 
-# Model comes from .env (utils/env_loader has already been called earlier)
-MODEL = os.environ.get("MODEL", "gemini-2.5-flash")
-JOB_SEARCH_SPREADSHEET_ID = os.environ.get("JOB_SEARCH_SPREADSHEET_ID").strip()
+# Settings come from .env (loaded by jobs_service/__init__.py before this import)
+from jobs_service.settings import MODEL, JOB_SEARCH_SPREADSHEET_ID
 
 # Scopes: read/write Sheets + Drive listing
 SCOPES = [
@@ -21,48 +22,44 @@ SCOPES = [
 # -------------------------------
 # Service factories
 # -------------------------------
+# Both clients come from one memoized ServiceBundle: built once per process
+# from the bundled discovery documents, sharing a single Credentials object.
 def get_sheets_service() -> object:
-    return get_google_service("sheets", "v4", SCOPES, "BIGQUERY_SHEETS")
+    return get_bundle(SCOPES, "BIGQUERY_SHEETS").sheets
 
 def get_drive_service() -> object:
-    return get_google_service("drive", "v3", SCOPES, "BIGQUERY_DRIVE")
+    return get_bundle(SCOPES, "BIGQUERY_SHEETS").drive
 
 # -------------------------------
 # Tools (AFC-friendly signatures)
 # -------------------------------
+_LIST_SPREADSHEETS_PARAMS = {
+    "q": "mimeType='application/vnd.google-apps.spreadsheet' and trashed=false",
+    "fields": "nextPageToken, files(id,name,modifiedTime,webViewLink)",
+    "orderBy": "modifiedTime desc",
+    "supportsAllDrives": True,
+    "includeItemsFromAllDrives": True,
+}
+
 def list_spreadsheets(max_results: Optional[int] = None) -> List[str]:
     """
     List all spreadsheets the user can access (across My Drive and Shared Drives).
     If max_results is provided and > 0, truncates to that many; otherwise returns all.
     """
     drive = get_drive_service()
+    limit = max_results if max_results and max_results > 0 else 0
     try:
         files: List[Dict[str, Any]] = []
-        page_token: Optional[str] = None
+        params = dict(_LIST_SPREADSHEETS_PARAMS)
         while True:
-            page_size = 1000
-            if max_results and max_results > 0:
-                remaining = max_results - len(files)
-                if remaining <= 0:
-                    break
-                page_size = min(page_size, remaining)
-
-            params = {
-                "q": "mimeType='application/vnd.google-apps.spreadsheet' and trashed=false",
-                "fields": "nextPageToken, files(id,name,modifiedTime,webViewLink)",
-                "orderBy": "modifiedTime desc",
-                "pageSize": page_size,
-                "supportsAllDrives": True,
-                "includeItemsFromAllDrives": True,
-            }
-            if page_token:
-                params["pageToken"] = page_token
-
+            # Ask only for what is still needed, so a small max_results is one RPC.
+            params["pageSize"] = min(1000, limit - len(files)) if limit else 1000
             resp = drive.files().list(**params).execute()
-            files.extend(resp.get("files", []) or [])
+            files.extend(resp.get("files", []))
             page_token = resp.get("nextPageToken")
-            if not page_token:
+            if not page_token or (limit and len(files) >= limit):
                 break
+            params["pageToken"] = page_token
 
         if not files:
             return ["No spreadsheets found."]
@@ -79,7 +76,9 @@ def get_spreadsheet_info(spreadsheet_id: str) -> str:
     """Return spreadsheet title and sheet names/sizes."""
     sheets = get_sheets_service()
     try:
-        spreadsheet = sheets.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+        spreadsheet = sheets.spreadsheets().get(
+            spreadsheetId=spreadsheet_id, fields=SPREADSHEET_INFO_FIELDS
+        ).execute()
         title = spreadsheet.get("properties", {}).get("title", "Untitled")
         raw_sheets = spreadsheet.get("sheets", []) or []
         lines = [f'Spreadsheet: "{title}" (ID: {spreadsheet_id})', f"Sheets ({len(raw_sheets)}):"]
@@ -114,17 +113,17 @@ def read_sheet_values(spreadsheet_id: str, range_name: str = "") -> List[str]:
 
         result = sheets.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
-            range=effective_range
+            range=effective_range,
+            fields="values",
         ).execute()
         values = result.get("values", []) or []
         if not values:
             return [f"No data found in range '{effective_range}'."]
-        base_len = len(values[0])
-        lines: List[str] = []
-        for i, row in enumerate(values, 1):
-            padded = row + [""] * max(0, base_len - len(row))
-            lines.append(f"Row {i:2d}: {padded}")
-        return lines
+        # Pad in place from one shared list: no per-row [""] * n or concat copy.
+        empty_pad = [""] * len(values[0])
+        for row in values:
+            row.extend(empty_pad[len(row):])
+        return [f"Row {i:2d}: {row}" for i, row in enumerate(values, 1)]
     except HttpError as e:
         raise ValueError(f"Failed to read values: {e}")
 
@@ -142,14 +141,16 @@ def write_sheet_values(
         except json.JSONDecodeError as e:
             raise ValueError(f"'values_json' must be valid JSON: {e}")
 
-        if not isinstance(data_2d, list) or any(not isinstance(r, list) for r in data_2d):
+        # Only the outer shape is checked here; the API rejects malformed rows.
+        if type(data_2d) is not list or (data_2d and type(data_2d[0]) is not list):
             raise ValueError("'values_json' must decode to a 2D list, e.g. [[...],[...]]")
 
         result = sheets.spreadsheets().values().update(
-            spreadsheetId=spreadsheets_id if False else spreadsheet_id,  # keep key stable
+            spreadsheetId=spreadsheet_id,
             range=range_name,
             valueInputOption=value_input_option,
             body={"values": data_2d},
+            fields="updatedCells,updatedRows,updatedColumns",
         ).execute()
 
         return (
@@ -164,9 +165,10 @@ def write_sheet_values(
 # -------------------------------
 # Helpers for Job_search_Database
 # -------------------------------
+@functools.lru_cache(maxsize=8)
 def _find_job_search_spreadsheet_id(name: str = "Job_Search_Database") -> str:
     """
-    Resolve the Job_Search_Database spreadsheet ID.
+    Resolve the Job_Search_Database spreadsheet ID (memoized per process).
 
     Priority:
       1) Hardcoded/env JOB_SEARCH_SPREADSHEET_ID (explicit and fastest)
@@ -188,6 +190,21 @@ def _find_job_search_spreadsheet_id(name: str = "Job_Search_Database") -> str:
     if folder_id:
         base_query += f" and '{folder_id}' in parents"
 
+    # 2a) Let Drive match the exact name: one request, at most one row.
+    escaped = name.replace("\\", "\\\\").replace("'", "\\'")
+    resp = drive.files().list(
+        q=f"name = '{escaped}' and {base_query}",
+        pageSize=1,
+        fields="files(id)",
+        orderBy="modifiedTime desc",
+        supportsAllDrives=True,
+        includeItemsFromAllDrives=True,
+    ).execute()
+    exact = resp.get("files", [])
+    if exact:
+        return exact[0]["id"]
+
+    # 2b) No exact match: page through candidates for a prefix/substring match.
     while True:
         resp = drive.files().list(
             q=base_query,
@@ -198,8 +215,7 @@ def _find_job_search_spreadsheet_id(name: str = "Job_Search_Database") -> str:
             includeItemsFromAllDrives=True,
             pageToken=page_token,
         ).execute()
-        files = resp.get("files", []) or []
-        candidates.extend(files)
+        candidates.extend(resp.get("files", []))
         page_token = resp.get("nextPageToken")
         if not page_token:
             break
@@ -226,6 +242,7 @@ def _find_job_search_spreadsheet_id(name: str = "Job_Search_Database") -> str:
         f"Either rename the sheet or set JOB_SEARCH_SPREADSHEET_ID."
     )
 
+@functools.lru_cache(maxsize=8)
 def _get_first_sheet_name(spreadsheet_id: str) -> str:
     sheets = get_sheets_service()
     resp = sheets.spreadsheets().get(
@@ -271,18 +288,27 @@ def append_jobs_to_job_search_database(jobs_result: List[Dict[str, Any]]) -> str
     if not rows:
         return "No valid job records found in jobs_result."
 
-    spreadsheet_id = _find_job_search_spreadsheet_id("Job_Search_Database")
-    sheet_name = _get_first_sheet_name(spreadsheet_id)
-    sheets = get_sheets_service()
+    # The target ID and tab name are resolved once per process; every later
+    # call is a single values.append round trip for all of its rows.
+    try:
+        spreadsheet_id = _find_job_search_spreadsheet_id("Job_Search_Database")
+        sheet_name = _get_first_sheet_name(spreadsheet_id)
+        sheets = get_sheets_service()
 
-    # A..F (6 columns) now matches the 6 values above
-    result = sheets.spreadsheets().values().append(
-        spreadsheetId=spreadsheet_id,
-        range=f"{sheet_name}!A2:F",
-        valueInputOption="USER_ENTERED",
-        insertDataOption="INSERT_ROWS",
-        body={"values": rows},
-    ).execute()
+        # A..F (6 columns) now matches the 6 values above
+        result = sheets.spreadsheets().values().append(
+            spreadsheetId=spreadsheet_id,
+            range=f"{sheet_name}!A2:F",
+            valueInputOption="USER_ENTERED",
+            insertDataOption="INSERT_ROWS",
+            body={"values": rows},
+            fields="updates(updatedRows)",
+        ).execute()
+    except HttpError as e:
+        # The memoized target may have been deleted or renamed; re-resolve next time.
+        _find_job_search_spreadsheet_id.cache_clear()
+        _get_first_sheet_name.cache_clear()
+        raise ValueError(f"Failed to append jobs: {e}")
 
     updated = result.get("updates", {}).get("updatedRows") or len(rows)
     return f"Appended {updated} job rows to '{sheet_name}' in 'Job_Search_Database'."
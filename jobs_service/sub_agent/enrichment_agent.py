@@ -4,7 +4,7 @@ import os
 import re
 import html as htmllib
 import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from googleapiclient.errors import HttpError
 from google.adk.agents import Agent
@@ -12,8 +12,7 @@ from google.genai import types
 
 from utils.google_service_helpers import get_google_service
 
-MODEL = os.environ.get("MODEL", "gemini-2.5-flash")
-JOB_SEARCH_SPREADSHEET_ID = os.environ.get("JOB_SEARCH_SPREADSHEET_ID").strip()
+from jobs_service.settings import MODEL, JOB_SEARCH_SPREADSHEET_ID
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -318,9 +317,78 @@ _YOE_PATTERNS = [
     r"\bintern(ship)?\b",
 ]
 
+# Compiled once at import: the pattern strings above stay readable, while the
+# extractors below never go through re's module-level pattern cache (which
+# 100+ skill patterns per description would otherwise churn).
+_DEGREE_PATTERNS = [(label, re.compile(pat, re.IGNORECASE)) for label, pat in _DEGREE_LEVELS]
+_SKILL_PATTERNS = [(name, re.compile(pat, re.IGNORECASE)) for name, pat in _SKILL_ALIASES.items()]
+_YOE_COMPILED = [re.compile(p, re.IGNORECASE) for p in _YOE_PATTERNS]
+
+
+# Skill matching prefilter. Every alternative of a skill pattern starts with a
+# fixed literal (e.g. "node" for r"node\.?js"), so a skill can only match if
+# one of those literals occurs in the lower-cased description. Checking that
+# with str `in` (a C-level substring scan) rules out most of the ~165 skills
+# without running their regex over the whole text.
+_ANCHOR_RE = re.compile(r"\\b|\(\?<!\\w\)")
+_LITERAL_ATOM_RE = re.compile(r"\\[^\w\s]|[\w#]")
+
+
+def _split_alternatives(pattern: str) -> List[str]:
+    """Split a regex on its top-level '|' (ignoring groups, classes, escapes)."""
+    parts: List[str] = []
+    depth = start = i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            i = pattern.index("]", i + 1) + 1
+            continue
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            parts.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    parts.append(pattern[start:])
+    return parts
+
+
+def _required_prefix(alternative: str) -> str:
+    """Return the lower-cased literal every match of this alternative starts with."""
+    pos = 0
+    while (m := _ANCHOR_RE.match(alternative, pos)):
+        pos = m.end()
+    literal: List[str] = []
+    while (m := _LITERAL_ATOM_RE.match(alternative, pos)):
+        atom = m.group()
+        if atom[0] == "\\" and atom[1:].isalnum():
+            break  # \s, \w, \d ... are classes, not literals
+        quantifier = alternative[m.end():m.end() + 1]
+        if quantifier in ("?", "*", "{"):
+            break  # optional atom: not guaranteed to be present
+        literal.append(atom[-1].lower())
+        pos = m.end()
+        if quantifier == "+":
+            break
+    return "".join(literal)
+
+
+def _skill_literals(pattern: str) -> Optional[Tuple[str, ...]]:
+    """Required literals for a skill pattern, or None if one cannot be derived."""
+    literals = tuple(_required_prefix(alt) for alt in _split_alternatives(pattern))
+    return literals if all(literals) else None
+
+
+_SKILL_INDEX = [(name, pat, _skill_literals(pat.pattern)) for name, pat in _SKILL_PATTERNS]
+
 def _extract_years_experience(text: str) -> str:
-    for p in _YOE_PATTERNS[:3]:
-        m = re.search(p, text, re.IGNORECASE)
+    for p in _YOE_COMPILED[:3]:
+        m = p.search(text)
         if m:
             gd = m.groupdict()
             minv = gd.get("min")
@@ -331,16 +399,16 @@ def _extract_years_experience(text: str) -> str:
                 return f"{minv}+ years"
             if maxv:
                 return f"up to {maxv} years"
-    if re.search(_YOE_PATTERNS[3], text, re.IGNORECASE):
+    if _YOE_COMPILED[3].search(text):
         return "0-1 years (entry level)"
-    if re.search(_YOE_PATTERNS[4], text, re.IGNORECASE):
+    if _YOE_COMPILED[4].search(text):
         return "0 years (internship)"
     return ""
 
 def _extract_degree(text: str) -> str:
     found = []
-    for label, pat in _DEGREE_LEVELS:
-        if re.search(pat, text, re.IGNORECASE):
+    for label, pat in _DEGREE_PATTERNS:
+        if pat.search(text):
             found.append(label)
     if not found:
         return ""
@@ -370,8 +438,13 @@ def _extract_skills(text: str, max_count: int = 30) -> str:
     if not text:
         return ""
 
-    # 1) Find all alias hits in the description
-    hits = {name for name, pat in _SKILL_ALIASES.items() if re.search(pat, text, re.IGNORECASE)}
+    # 1) Find all alias hits in the description (regex only for plausible skills)
+    lowered = text.lower()
+    hits = {
+        name
+        for name, pat, literals in _SKILL_INDEX
+        if (literals is None or any(lit in lowered for lit in literals)) and pat.search(text)
+    }
     if not hits:
         return ""
 
@@ -487,6 +560,20 @@ def _extract_all_fields(text: str) -> Dict[str, str]:
 # HTML / description helpers
 # -------------------------------
 
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+# Opening/closing block-level tags, turned into newlines to keep structure.
+_BLOCK_TAGS_RE = re.compile(
+    r"</?(?:p|div|br|li|ul|ol|section|article|h1|h2|h3|h4|h5|h6|table|tr|td|th)[^>]*>",
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_CR_RE = re.compile(r"\r")
+_WS_RE = re.compile(r"[ \t]+")
+_NL_RE = re.compile(r"\n{3,}")
+_GH_BOARD_RE = re.compile(r"job-boards\.greenhouse\.io/([^/]+)/jobs/")
+_GH_JID_RE = re.compile(r"[?&]gh_jid=(\d+)")
+
 def _html_to_text_full(html: str) -> str:
     """
     Convert HTML to full plain text with structure preserved (no truncation).
@@ -494,21 +581,15 @@ def _html_to_text_full(html: str) -> str:
     if not html:
         return ""
 
-    html = re.sub(r"<script[^>]*>.*?</script>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r"<style[^>]*>.*?</style>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-
-    block_tags = [
-        "p","div","br","li","ul","ol","section","article",
-        "h1","h2","h3","h4","h5","h6","table","tr","td","th"
-    ]
-    for tag in block_tags:
-        html = re.sub(fr"</?{tag}[^>]*>", "\n", html, flags=re.IGNORECASE)
+    html = _SCRIPT_RE.sub(" ", html)
+    html = _STYLE_RE.sub(" ", html)
+    html = _BLOCK_TAGS_RE.sub("\n", html)
 
-    text = re.sub(r"<[^>]+>", " ", html)
+    text = _TAG_RE.sub(" ", html)
     text = htmllib.unescape(text)
-    text = re.sub(r"\r", "\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _CR_RE.sub("\n", text)
+    text = _WS_RE.sub(" ", text)
+    text = _NL_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -524,7 +605,7 @@ def _infer_greenhouse_company_from_url(url: str) -> Optional[str]:
     for domain, board in GH_COMPANY_FROM_DOMAIN.items():
         if domain in url_lower:
             return board
-    m = re.search(r"job-boards\.greenhouse\.io/([^/]+)/jobs/", url_lower)
+    m = _GH_BOARD_RE.search(url_lower)
     if m:
         return m.group(1)
     return None
@@ -534,7 +615,7 @@ def _fetch_description_from_url(url: str) -> str:
     if not url:
         return ""
 
-    gh_match = re.search(r"[?&]gh_jid=(\d+)", url)
+    gh_match = _GH_JID_RE.search(url)
     if gh_match:
         job_id = gh_match.group(1)
         company = _infer_greenhouse_company_from_url(url)
@@ -30,10 +30,9 @@ Use `format_jobs_for_display` ONLY when you need a human-readable string.
 
 from __future__ import annotations
 
-import os
 import re
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 
 import requests
 from google.adk.agents import Agent
@@ -44,12 +43,29 @@ import json
 
 from utils.time_utils import get_time_context
 
-MODEL = os.environ.get("MODEL", "gemini-2.5-flash")
+from jobs_service.settings import MODEL
 
 # -------------------------------
 # Helpers
 # -------------------------------
 
+# Patterns are compiled once at import rather than looked up in re's cache on
+# every call; search_jobs and the description parsers run per job listing.
+# Script/style blocks, any other tag, and whitespace, matched as one run so
+# _normalize_text strips markup and collapses spacing in a single pass.
+_MARKUP_RE = re.compile(
+    r"(?:<script[^>]*>.*?</script>|<style[^>]*>.*?</style>|<[^>]+>|\s)+",
+    re.DOTALL | re.IGNORECASE,
+)
+_EXP_RE = re.compile(r"(\d+)\s*(?:\+?\s*)?(?:years?|yrs?)", re.I)
+_EXP_RANGE_RE = re.compile(
+    r'(?:(?:at\s+least|minimum|over|around)\s*)?'
+    r'(\d+)\s*(?:[-to–]\s*(\d+))?\s*(?:\+?\s*)?(?:years?|yrs?)',
+    re.IGNORECASE,
+)
+_TITLE_RE = re.compile(r"(?:job|role|position)\s*(?:for|as)?\s*([\w\s\-]+)", re.IGNORECASE)
+
+
 def _parse_iso(ts: str) -> Optional[datetime]:
     if not ts:
         return None
@@ -87,17 +103,14 @@ def _is_recent(ts: Optional[datetime], cutoff: Optional[datetime]) -> bool:
 def _normalize_text(html_or_text: Optional[str]) -> str:
     if not html_or_text:
         return ""
-    text = re.sub(r"<script[^>]*>.*?</script>", " ", html_or_text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<style[^>]*>.*?</style>", " ", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
+    return _MARKUP_RE.sub(" ", html_or_text).strip()
 
 
 def _parse_experience(text: str) -> Optional[int]:
     if not text:
         return None
 
-    m = re.search(r"(\d+)\s*(?:\+?\s*)?(?:years?|yrs?)", text, re.I)
+    m = _EXP_RE.search(text)
     if m:
         return int(m.group(1))
 
@@ -125,12 +138,7 @@ def find_experience_in_description(description: str) -> Optional[int]:
         return None
 
     text = description.lower()
-    match = re.search(
-        r'(?:(?:at\s+least|minimum|over|around)\s*)?'
-        r'(\d+)\s*(?:[-to–]\s*(\d+))?\s*(?:\+?\s*)?(?:years?|yrs?)',
-        text,
-        re.IGNORECASE,
-    )
+    match = _EXP_RANGE_RE.search(text)
     if not match:
         return None
 
@@ -270,12 +278,8 @@ def search_jobs(
     companies = _get_companies(session, companies)
     years_exp = _parse_experience(query)
 
-    title_match = re.findall(
-        r"(?:job|role|position)\s*(?:for|as)?\s*([\w\s\-]+)",
-        query,
-        re.IGNORECASE,
-    )
-    target_title = title_match[0].strip() if title_match else query.strip()
+    title_match = _TITLE_RE.search(query)
+    target_title = title_match.group(1).strip() if title_match else query.strip()
 
     combined: List[Dict[str, Any]] = []
 
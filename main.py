@@ -9,12 +9,15 @@ SESSION_SERVICE_URI = "sqlite:////tmp/sessions.db"
 ALLOWED_ORIGINS = ["*"]
 SERVE_WEB_INTERFACE = True
 
-app: FastAPI = get_fast_api_app(
-    agents_dir=AGENT_DIR,
-    session_service_uri=SESSION_SERVICE_URI,
-    allow_origins=ALLOWED_ORIGINS,
-    web=SERVE_WEB_INTERFACE,
-)
+# Worker processes spawned by utils.pdf_text re-import this script as
+# __mp_main__ when it is run directly; they must not build the whole app.
+if __name__ != "__mp_main__":
+    app: FastAPI = get_fast_api_app(
+        agents_dir=AGENT_DIR,
+        session_service_uri=SESSION_SERVICE_URI,
+        allow_origins=ALLOWED_ORIGINS,
+        web=SERVE_WEB_INTERFACE,
+    )
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
@@ -0,0 +1,300 @@
+"""
+On-disk TTL cache for Google Drive listing results.
+
+Agent turns frequently re-list the same Drive contents (list_docs,
+list_drive_files), and each full listing can page through thousands of
+files. This module stores those results in a small SQLite database so that
+repeated listings within the TTL are served without any Drive API round trip.
+
+Usage:
+
+    from utils import drive_cache
+
+    files = drive_cache.cached(
+        "list_docs",
+        {"max_results": max_results},
+        lambda: _fetch_docs(drive, max_results),
+        refresh=refresh,
+    )
+
+Configuration (environment variables):
+    DRIVE_CACHE_PATH: SQLite file location. Defaults to
+        .creds/cache/drive_cache.sqlite3 next to the OAuth credentials.
+    DRIVE_CACHE_TTL: Freshness window in seconds (default 300).
+
+It also keeps a local index of Drive file metadata that is kept current
+through Drive's change feed (changes.list + startPageToken), so full
+listings only need to be paged once; afterwards each sync costs O(changes).
+See index_* below and google_drive_service.agent_google_drive._ensure_index.
+
+Notes:
+    - Payloads are JSON, zlib-compressed. Only JSON-serializable values
+      (lists/dicts of Drive metadata) should be cached.
+    - The database holds file names and links, so it is created owner-only
+      (0600, in a 0700 directory) alongside the OAuth token. Keys and index
+      rows include the token path, which keeps separate OAuth accounts apart
+      when several share one database file.
+    - If the database cannot be opened or written (e.g. a read-only
+      filesystem), the cache silently degrades to calling ``fetch``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_TTL = float(os.environ.get("DRIVE_CACHE_TTL", "300"))
+_DB_PATH = os.environ.get("DRIVE_CACHE_PATH") or str(
+    Path(__file__).resolve().parents[1] / ".creds" / "cache" / "drive_cache.sqlite3"
+)
+
+_LOCK = threading.Lock()
+_CONN: Optional[sqlite3.Connection] = None
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Open (once) and return the cache database, or None if unavailable."""
+    global _CONN
+    if _CONN is None:
+        try:
+            os.makedirs(os.path.dirname(_DB_PATH) or ".", mode=0o700, exist_ok=True)
+            # Create the file owner-only before SQLite opens it; tighten an
+            # existing file too, in case an older run created it world-readable.
+            os.close(os.open(_DB_PATH, os.O_RDWR | os.O_CREAT, 0o600))
+            os.chmod(_DB_PATH, 0o600)
+            conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL, payload BLOB)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "user TEXT, id TEXT, name TEXT, mimeType TEXT, modifiedTime TEXT, "
+                "webViewLink TEXT, parents TEXT, PRIMARY KEY (user, id))"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS sync (user TEXT PRIMARY KEY, token TEXT)")
+            conn.commit()
+            _CONN = conn
+        except (OSError, sqlite3.Error):
+            return None
+    return _CONN
+
+
+def _user() -> str:
+    return os.environ.get("GOOGLE_OAUTH_TOKEN_FILE", "")
+
+
+def cache_key(namespace: str, params: Dict[str, Any]) -> str:
+    """Return a stable key for a namespace and its parameters.
+
+    Keys start with ``namespace:`` so invalidate() can drop a whole namespace.
+    """
+    scoped = {
+        "ns": namespace,
+        "user": _user(),
+        "params": params,
+    }
+    digest = hashlib.sha1(json.dumps(scoped, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def get(key: str, ttl: float = DEFAULT_TTL) -> Optional[Any]:
+    """Return the cached value for key if it is younger than ttl seconds."""
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT ts, payload FROM cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+    if row is None or time.time() - row[0] >= ttl:
+        return None
+    return json.loads(zlib.decompress(row[1]))
+
+
+def put(key: str, value: Any) -> None:
+    """Store value under key with the current timestamp."""
+    payload = zlib.compress(json.dumps(value).encode("utf-8"))
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, payload) VALUES (?, ?, ?)",
+                (key, time.time(), payload),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def invalidate(namespace: str) -> None:
+    """Drop every cached value in namespace (e.g. after a write that changes it)."""
+    prefix = f"{namespace}:"
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.execute("DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def cached(
+    namespace: str,
+    params: Dict[str, Any],
+    fetch: Callable[[], Any],
+    refresh: bool = False,
+    ttl: float = DEFAULT_TTL,
+) -> Any:
+    """Return a fresh cached value, or call fetch() and cache its result.
+
+    Args:
+        namespace: Logical name of the cached call (e.g. 'list_docs').
+        params: JSON-serializable parameters that identify the result.
+        fetch: Zero-argument callable producing the value on a miss.
+        refresh: If True, bypass the cached value and re-fetch.
+        ttl: Freshness window in seconds.
+    """
+    key = cache_key(namespace, params)
+    if not refresh:
+        hit = get(key, ttl)
+        if hit is not None:
+            return hit
+    value = fetch()
+    put(key, value)
+    return value
+
+
+# ------------------------------------------
+# Drive file index (change-feed backed)
+# ------------------------------------------
+_FILE_COLUMNS = ("id", "name", "mimeType", "modifiedTime", "webViewLink", "parents")
+
+
+def _file_row(user: str, f: Dict[str, Any]) -> tuple:
+    return (
+        user,
+        f["id"],
+        f.get("name"),
+        f.get("mimeType"),
+        f.get("modifiedTime"),
+        f.get("webViewLink"),
+        json.dumps(f.get("parents") or []),
+    )
+
+
+def index_token() -> Optional[str]:
+    """Return the stored change-feed page token, or None if the index is unseeded."""
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT token FROM sync WHERE user = ?", (_user(),)).fetchone()
+        except sqlite3.Error:
+            return None
+    return row[0] if row else None
+
+
+def index_seed(files: List[Dict[str, Any]], token: str) -> bool:
+    """Replace the index with a full listing and remember the start token.
+
+    Returns False if the index could not be written.
+    """
+    user = _user()
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return False
+        try:
+            with conn:
+                conn.execute("DELETE FROM files WHERE user = ?", (user,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [_file_row(user, f) for f in files],
+                )
+                conn.execute("INSERT OR REPLACE INTO sync VALUES (?, ?)", (user, token))
+        except sqlite3.Error:
+            return False
+    return True
+
+
+def index_reset() -> None:
+    """Forget the stored change-feed token so the next sync reseeds the index."""
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.execute("DELETE FROM sync WHERE user = ?", (_user(),))
+        except sqlite3.Error:
+            pass
+
+
+def index_apply(changes: List[Dict[str, Any]], token: str) -> None:
+    """Apply a page of Drive changes and advance the stored token."""
+    user = _user()
+    upserts = []
+    removals = []
+    for c in changes:
+        f = c.get("file") or {}
+        if c.get("removed") or f.get("trashed"):
+            removals.append((user, c.get("fileId")))
+        elif f.get("id"):
+            upserts.append(_file_row(user, f))
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany("DELETE FROM files WHERE user = ? AND id = ?", removals)
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", upserts)
+                conn.execute("INSERT OR REPLACE INTO sync VALUES (?, ?)", (user, token))
+        except sqlite3.Error:
+            pass
+
+
+def index_query(
+    folder_id: str = "", mime_type: str = "", limit: int = 0
+) -> Optional[List[Dict[str, Any]]]:
+    """Return indexed files, newest first, optionally filtered by parent and type.
+
+    Returns None if the index cannot be read, so callers can list from Drive.
+    """
+    sql = "SELECT id, name, mimeType, modifiedTime, webViewLink, parents FROM files WHERE user = ?"
+    args: List[Any] = [_user()]
+    if folder_id:
+        sql += " AND parents LIKE ?"
+        args.append(f'%"{folder_id}"%')
+    if mime_type:
+        sql += " AND mimeType = ?"
+        args.append(mime_type)
+    sql += " ORDER BY modifiedTime DESC"
+    if limit > 0:
+        sql += " LIMIT ?"
+        args.append(limit)
+    with _LOCK:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            rows = conn.execute(sql, args).fetchall()
+        except sqlite3.Error:
+            return None
+    return [
+        {**dict(zip(_FILE_COLUMNS, r)), "parents": json.loads(r[5])}
+        for r in rows
+    ]
@@ -54,14 +54,25 @@ Notes:
 
 from __future__ import annotations
 
+import datetime
+import functools
+import json
+import logging
 import os
+import queue
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import HttpRequest
 
 # Import the helper to set environment variables for credentials. This ensures
 # GOOGLE_OAUTH_CLIENT_FILE and GOOGLE_OAUTH_TOKEN_FILE are defined and
@@ -72,27 +83,26 @@ except Exception:
     ensure_google_oauth_env = None  # type: ignore
 
 
-def _get_service_credentials(service_label: str, scopes: List[str]) -> Credentials:
-    """Return authorized Credentials for the given service label and scopes.
+logger = logging.getLogger(__name__)
 
-    This function handles reading the credentials and token paths from
-    environment variables, refreshing them if expired, or running the
-    interactive OAuth flow if needed. It relies on utils.routing to set
-    environment variables to absolute paths if they aren't already set.
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]  # fallback: up two levels
+_CREDENTIAL_PATHS: tuple[str, str] | None = None
 
-    Args:
-        service_label: A short descriptor used in log messages and errors.
-        scopes: A list of OAuth scopes required for the service.
 
-    Returns:
-        google.oauth2.credentials.Credentials: Authorized credentials for
-            interacting with Google APIs.
+def _credential_paths(service_label: str) -> tuple[str, str]:
+    """Return the absolute (credentials_path, token_path) pair.
+
+    The environment lookup and path joins only run until they succeed once;
+    later calls return the cached pair. Failures are not cached so a missing
+    env var can still be fixed (e.g. by a late load_dotenv) without a restart.
 
     Raises:
         EnvironmentError: If the expected environment variables are missing.
-        FileNotFoundError: If the credentials file cannot be located.
-        RuntimeError: If credentials could not be acquired.
     """
+    global _CREDENTIAL_PATHS
+    if _CREDENTIAL_PATHS is not None:
+        return _CREDENTIAL_PATHS
+
     # Ensure environment variables are set to absolute paths.
     if ensure_google_oauth_env:
         try:
@@ -110,17 +120,43 @@ def _get_service_credentials(service_label: str, scopes: List[str]) -> Credentia
 
     # Both credentials_rel and token_rel should be absolute if ensure_google_oauth_env ran.
     # If not absolute (for robustness), treat them as relative to the project root.
-    if os.path.isabs(credentials_rel):
-        credentials_path = credentials_rel
-    else:
-        project_root = Path(__file__).resolve().parents[2]  # fallback: up two levels
-        credentials_path = os.path.join(project_root, credentials_rel)
+    _CREDENTIAL_PATHS = (
+        os.path.join(_PROJECT_ROOT, credentials_rel),
+        os.path.join(_PROJECT_ROOT, token_rel),
+    )
+    return _CREDENTIAL_PATHS
 
-    if os.path.isabs(token_rel):
-        token_path = token_rel
-    else:
-        project_root = Path(__file__).resolve().parents[2]
-        token_path = os.path.join(project_root, token_rel)
+
+def _get_service_credentials(service_label: str, scopes: List[str]) -> Credentials:
+    """Return authorized Credentials for the given service label and scopes.
+
+    This function handles reading the credentials and token paths from
+    environment variables, refreshing them if expired, or running the
+    interactive OAuth flow if needed. It relies on utils.routing to set
+    environment variables to absolute paths if they aren't already set.
+
+    Args:
+        service_label: A short descriptor used in log messages and errors.
+        scopes: A list of OAuth scopes required for the service.
+
+    Returns:
+        google.oauth2.credentials.Credentials: Authorized credentials for
+            interacting with Google APIs.
+
+    Raises:
+        EnvironmentError: If the expected environment variables are missing.
+        FileNotFoundError: If the credentials file cannot be located.
+        RuntimeError: If credentials could not be acquired.
+    """
+    credentials_path, token_path = _credential_paths(service_label)
+
+    # Reuse the Credentials already loaded from this token file unless the
+    # file has changed on disk since (e.g. re-authorized in another process).
+    with _CREDS_LOCK:
+        cached = _CREDS_CACHE.get(token_path)
+    if cached is not None and cached[0] == _token_mtime(token_path):
+        if cached[1].valid or cached[1].refresh_token:
+            return cached[1]
 
     creds: Credentials | None = None
 
@@ -134,39 +170,237 @@ def _get_service_credentials(service_label: str, scopes: List[str]) -> Credentia
     # Refresh or run OAuth if necessary.
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
-            print(f"[{service_label}] Refreshing expired credentials…")
+            logger.debug("[%s] Refreshing expired credentials", service_label)
             creds.refresh(Request())
-            try:
-                with open(token_path, "w", encoding="utf-8") as f:
-                    f.write(creds.to_json())
-            except PermissionError:
-                # Likely running in a read-only environment (e.g., Cloud Run).
-                # That's okay: we can still use the refreshed in-memory credentials.
-                print(
-                    f"[{service_label}] Warning: cannot write refreshed token to {token_path} "
-                    "(read-only filesystem). Continuing with in-memory credentials."
-                )
+            _REFRESHER.persist(token_path, creds, service_label)
 
         else:
             if not os.path.exists(credentials_path):
                 raise FileNotFoundError(
                     f"[{service_label}] Missing credentials.json at {credentials_path}"
                 )
-            print(f"[{service_label}] Launching browser for new OAuth flow…")
+            # Only needed on first run, so keep it off the import path.
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
+            logger.info("[%s] Launching browser for new OAuth flow", service_label)
             flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes)
             creds = flow.run_local_server(port=0)
             os.makedirs(Path(token_path).parent, exist_ok=True)
-            with open(token_path, "w", encoding="utf-8") as f:
-                f.write(creds.to_json())
+            _REFRESHER.persist(token_path, creds, service_label)
 
     if creds is None:
         raise RuntimeError(f"[{service_label}] Failed to obtain credentials.")
 
+    with _CREDS_LOCK:
+        _CREDS_CACHE[token_path] = (_token_mtime(token_path), creds)
+    _REFRESHER.watch(creds, token_path, service_label)
     return creds
 
 
-def get_google_service(api_name: str, version: str, scopes: List[str], service_label: str):
-    """Construct and return a Google API service.
+# token_path -> (file mtime when loaded, Credentials loaded from it)
+_CREDS_CACHE: Dict[str, Tuple[int | None, Credentials]] = {}
+_CREDS_LOCK = threading.Lock()
+
+
+def _token_mtime(token_path: str) -> int | None:
+    try:
+        return os.stat(token_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _write_token(token_path: str, payload: str, service_label: str) -> None:
+    """Persist a token atomically, tolerating read-only filesystems.
+
+    The payload is fsynced to a temporary file that then replaces token.json,
+    so a crash (or power loss) mid-write can never leave a truncated token
+    behind and force a browser re-authorization.
+    """
+    tmp_path = f"{token_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, token_path)
+    except OSError as e:
+        # Don't leave a partial temp file (holding a refresh token) behind.
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        if not isinstance(e, PermissionError):
+            raise
+        # Likely running in a read-only environment (e.g., Cloud Run).
+        # That's okay: we can still use the refreshed in-memory credentials.
+        logger.warning(
+            "[%s] Cannot write refreshed token to %s (read-only filesystem). "
+            "Continuing with in-memory credentials.",
+            service_label,
+            token_path,
+        )
+        return
+    # Our own write must not look like an external change to the cache.
+    with _CREDS_LOCK:
+        cached = _CREDS_CACHE.get(token_path)
+        if cached is not None:
+            _CREDS_CACHE[token_path] = (_token_mtime(token_path), cached[1])
+
+
+# Refresh tokens this long before they expire, checking at this interval.
+# google-auth refreshes inline only once a token is within ~4 minutes of
+# expiry, so refreshing earlier keeps that round trip off tool calls.
+REFRESH_MARGIN = datetime.timedelta(seconds=300)
+REFRESH_POLL_SECONDS = 60
+
+
+class _TokenRefresher:
+    """Refresh watched credentials in the background before they expire.
+
+    Credentials objects are shared by the cached services' transports, so
+    refreshing them in place means requests keep finding a valid token.
+    Refreshed tokens are written to disk by a single writer thread, keeping
+    file I/O off the request path as well.
+
+    Credentials are held by weak reference, so ones dropped from the caches
+    (e.g. after reset_services or a token.json reload) stop being refreshed
+    and are pruned instead of accumulating.
+    """
+
+    def __init__(self):
+        self._watched: Dict[int, Tuple["weakref.ref[Credentials]", str, str]] = {}
+        self._lock = threading.Lock()
+        self._writes: "queue.Queue[Tuple[str, str, str]]" = queue.Queue()
+        self._started = False
+
+    def watch(self, creds: Credentials, token_path: str, service_label: str) -> None:
+        if not creds.refresh_token:
+            return
+        with self._lock:
+            self._watched[id(creds)] = (weakref.ref(creds), token_path, service_label)
+            if not self._started:
+                self._started = True
+                threading.Thread(target=self._refresh_loop, name="token-refresher", daemon=True).start()
+                threading.Thread(target=self._write_loop, name="token-writer", daemon=True).start()
+
+    def persist(self, token_path: str, creds: Credentials, service_label: str) -> None:
+        """Queue the current token for writing (synchronously if no writer yet)."""
+        if self._started:
+            self._writes.put((token_path, creds.to_json(), service_label))
+        else:
+            _write_token(token_path, creds.to_json(), service_label)
+
+    def _refresh_loop(self) -> None:
+        while True:
+            time.sleep(REFRESH_POLL_SECONDS)
+            watched = []
+            with self._lock:
+                for key, (ref, token_path, service_label) in list(self._watched.items()):
+                    creds = ref()
+                    if creds is None:
+                        del self._watched[key]
+                    else:
+                        watched.append((creds, token_path, service_label))
+            # google-auth keeps expiry as naive UTC.
+            now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+            for creds, token_path, service_label in watched:
+                if creds.expiry is None or creds.expiry - now > REFRESH_MARGIN:
+                    continue
+                try:
+                    creds.refresh(Request())
+                except Exception:
+                    continue  # the request path will refresh inline instead
+                self._writes.put((token_path, creds.to_json(), service_label))
+
+    def _write_loop(self) -> None:
+        while True:
+            token_path, payload, service_label = self._writes.get()
+            try:
+                _write_token(token_path, payload, service_label)
+            except OSError:
+                # Keep the writer alive; the in-memory credentials stay valid
+                # and the next refresh will try to persist again.
+                logger.warning(
+                    "[%s] Failed to write refreshed token to %s.",
+                    service_label,
+                    token_path,
+                    exc_info=True,
+                )
+
+
+_REFRESHER = _TokenRefresher()
+
+
+# Socket timeout (seconds) for every transport built here. httplib2 keeps one
+# persistent keep-alive connection per host on each Http instance.
+HTTP_TIMEOUT = 30
+
+
+def _new_http() -> httplib2.Http:
+    return httplib2.Http(timeout=HTTP_TIMEOUT)
+
+
+def _authorized_http(creds: Credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """Return an authorized keep-alive transport.
+
+    googleapiclient already asks for gzip (accept-encoding plus "(gzip)" in
+    the user-agent) on every model request, so no extra headers are set here.
+    """
+    return google_auth_httplib2.AuthorizedHttp(creds, http=_new_http())
+
+
+def _thread_request_builder(creds: Credentials):
+    """Return a requestBuilder that binds each request to a per-thread transport.
+
+    httplib2.Http is not thread-safe, so a service shared across threads must
+    not send every request through one socket. Each thread lazily gets its own
+    authorized keep-alive transport; single-threaded callers see exactly one.
+
+    A request is bound to the transport of the thread that *builds* it. Build
+    requests in the thread that executes them; a request handed to another
+    thread must be run there with ``execute(http=get_thread_http(...))``.
+    """
+    local = threading.local()
+
+    def thread_http() -> google_auth_httplib2.AuthorizedHttp:
+        http = getattr(local, "http", None)
+        if http is None:
+            http = local.http = _authorized_http(creds)
+        return http
+
+    def builder(http, *args, **kwargs):
+        return HttpRequest(thread_http(), *args, **kwargs)
+
+    builder.thread_http = thread_http  # type: ignore[attr-defined]
+    return builder
+
+
+def _transports(creds: Credentials) -> Dict[str, Any]:
+    """Return build() kwargs: a base transport plus per-thread request binding."""
+    return {
+        "http": _authorized_http(creds),
+        "requestBuilder": _thread_request_builder(creds),
+    }
+
+
+_SERVICES: Dict[Tuple[Any, ...], Any] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_google_service(
+    api_name: str,
+    version: str,
+    scopes: List[str],
+    service_label: str,
+):
+    """Return a Google API service, building it on first use.
+
+    Built services are memoized per (api, version, scopes, label), so
+    repeated tool calls reuse one client instead of re-reading token.json and
+    re-assembling the discovery document every time. The cached client keeps
+    its credentials fresh through the authorized transport, and is safe to
+    share across threads: each thread's requests run on that thread's own
+    transport.
 
     Args:
         api_name: The name of the Google API (e.g., 'drive', 'sheets', 'docs').
@@ -180,9 +414,114 @@ def get_google_service(api_name: str, version: str, scopes: List[str], service_l
     Raises:
         RuntimeError: If the service could not be built.
     """
-    creds = _get_service_credentials(service_label, scopes)
+    key = (api_name, version, tuple(scopes), service_label)
+    service = _SERVICES.get(key)
+    if service is not None:
+        return service
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(key)
+        if service is None:
+            service = _build_service(api_name, version, scopes, service_label)
+            _SERVICES[key] = service
+    return service
+
+
+def reset_services() -> None:
+    """Drop all memoized services and credentials (e.g. after rotating token.json)."""
+    with _SERVICES_LOCK:
+        _SERVICES.clear()
+        _BUNDLES.clear()
+    with _CREDS_LOCK:
+        _CREDS_CACHE.clear()
+
+
+# Discovery documents not bundled with googleapiclient are fetched once and
+# kept here, so later process starts skip the HTTPS round trip.
+DISCOVERY_CACHE_DIR = os.environ.get("GOOGLE_DISCOVERY_CACHE_DIR") or str(
+    Path(__file__).resolve().parents[1] / ".creds" / "discovery"
+)
+_DISCOVERY_URLS = (
+    "https://www.googleapis.com/discovery/v1/apis/{api}/{version}/rest",
+    "https://{api}.googleapis.com/$discovery/rest?version={version}",
+)
+
+
+def _cached_discovery(api_name: str, version: str) -> str | None:
+    """Return discovery JSON from the on-disk cache, fetching it on a miss.
+
+    Returns None if the document can be neither read nor fetched; callers
+    then fall back to googleapiclient's own discovery.
+    """
+    path = os.path.join(DISCOVERY_CACHE_DIR, f"{api_name}-{version}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    http = _new_http()
+    for url in _DISCOVERY_URLS:
+        try:
+            resp, content = http.request(url.format(api=api_name, version=version))
+        except Exception:
+            continue
+        if resp.status == 200:
+            break
+    else:
+        return None
+
+    doc = content.decode("utf-8")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(DISCOVERY_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(doc)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.debug("Cannot cache discovery document at %s", path)
+    return doc
+
+
+@functools.lru_cache(maxsize=None)
+def _discovery_doc(api_name: str, version: str) -> Dict[str, Any] | None:
+    """Return the parsed discovery document for an API.
+
+    Uses the copy shipped with googleapiclient, else the on-disk cache (see
+    _cached_discovery). Parsed once per process and shared by every build, so
+    services for the same API under different scopes/labels do not each
+    re-parse the (hundreds of KB) JSON. Returns None if neither is available.
+    """
+    doc = get_static_doc(api_name, version) or _cached_discovery(api_name, version)
+    return json.loads(doc) if doc else None
+
+
+def _build_service(
+    api_name: str,
+    version: str,
+    scopes: List[str],
+    service_label: str,
+    auth: Dict[str, Any] | None = None,
+):
+    """Authorize and build a service from the bundled static discovery document.
+
+    ``auth`` (an ``http``/``requestBuilder`` pair from _transports) lets
+    several services share one set of transports; by default the service
+    gets its own.
+    """
+    if auth is None:
+        auth = _transports(_get_service_credentials(service_label, scopes))
     try:
-        service = build(api_name, version, credentials=creds, cache_discovery=False)
+        doc = _discovery_doc(api_name, version)
+        if doc is not None:
+            service = build_from_document(doc, **auth)
+        else:
+            service = build(
+                api_name,
+                version,
+                cache_discovery=False,
+                static_discovery=False,
+                **auth,
+            )
     except Exception as e:
         raise RuntimeError(
             f"[{service_label}] Failed to build {api_name.capitalize()} service: {e}"
@@ -190,6 +529,132 @@ def get_google_service(api_name: str, version: str, scopes: List[str], service_l
     return service
 
 
+class ServiceBundle:
+    """Google API clients built lazily from one shared Credentials object.
+
+    Agents that talk to several APIs (e.g. the Docs agent lists files through
+    Drive and reads them through Docs) load and refresh token.json once for
+    the set instead of once per service. The services also share transports:
+    each thread sends every Docs/Drive/Sheets request of the bundle through
+    one keep-alive Http, and thread_http() hands out that same transport for
+    explicit ``execute(http=...)`` calls. Requests must therefore be built in
+    the thread that executes them (see _thread_request_builder).
+    """
+
+    def __init__(self, scopes: List[str], service_label: str):
+        self._scopes = list(scopes)
+        self._label = service_label
+        self._auth: Dict[str, Any] | None = None
+        self._services: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _transports(self) -> Dict[str, Any]:
+        if self._auth is None:
+            with self._lock:
+                if self._auth is None:
+                    creds = _get_service_credentials(self._label, self._scopes)
+                    self._auth = _transports(creds)
+        return self._auth
+
+    def _service(self, api_name: str, version: str):
+        service = self._services.get(api_name)
+        if service is None:
+            auth = self._transports()
+            with self._lock:
+                service = self._services.get(api_name)
+                if service is None:
+                    service = _build_service(
+                        api_name, version, self._scopes, self._label, auth=auth
+                    )
+                    self._services[api_name] = service
+        return service
+
+    def thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return the calling thread's transport for this bundle."""
+        return self._transports()["requestBuilder"].thread_http()
+
+    @property
+    def docs(self):
+        return self._service("docs", "v1")
+
+    @property
+    def drive(self):
+        return self._service("drive", "v3")
+
+    @property
+    def sheets(self):
+        return self._service("sheets", "v4")
+
+
+_BUNDLES: Dict[Tuple[Any, ...], ServiceBundle] = {}
+
+# Partial-response mask for spreadsheets.get in the Sheets-backed agents' info
+# tools: just the title and each tab's name, ID and size, not the full
+# spreadsheet resource (grid data, formats, ...).
+SPREADSHEET_INFO_FIELDS = (
+    "properties.title,sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))"
+)
+
+
+def get_bundle(scopes: List[str], service_label: str) -> ServiceBundle:
+    """Return the memoized ServiceBundle for these scopes and label."""
+    key = (tuple(scopes), service_label)
+    bundle = _BUNDLES.get(key)
+    if bundle is None:
+        with _SERVICES_LOCK:
+            bundle = _BUNDLES.setdefault(key, ServiceBundle(scopes, service_label))
+    return bundle
+
+
+def get_thread_http(scopes: List[str], service_label: str) -> google_auth_httplib2.AuthorizedHttp:
+    """Return an authorized HTTP transport owned by the calling thread.
+
+    httplib2 connections are not thread-safe, so code that fans requests out
+    over a thread pool should pass this to ``request.execute(http=...)``
+    instead of sharing the service's own transport. It is the same per-thread
+    transport the bundle's services use, so no extra connections are opened.
+
+    Because that transport is shared by every request the thread builds, never
+    execute it (or a request built on this thread) from another thread: build
+    and run each request inside the worker that owns it.
+    """
+    return get_bundle(scopes, service_label).thread_http()
+
+
+# Drive allows at most 100 sub-requests per batch call.
+BATCH_LIMIT = 100
+
+
+def batch_get_files(drive, file_ids: Iterable[str], fields: str, **kwargs) -> Dict[str, Any]:
+    """Fetch Drive metadata for many files using batched files.get calls.
+
+    Sub-requests are grouped into multipart batches of up to BATCH_LIMIT,
+    so N lookups cost ceil(N/100) HTTP round trips instead of N.
+
+    Args:
+        drive: An authenticated Drive v3 service.
+        file_ids: The file IDs to look up.
+        fields: Partial-response field mask for each files.get call.
+        **kwargs: Extra files.get parameters (e.g. supportsAllDrives=True).
+
+    Returns:
+        A dict mapping each file ID to its metadata dict, or to the
+        HttpError raised for that sub-request.
+    """
+    ids = list(dict.fromkeys(file_ids))
+    results: Dict[str, Any] = {}
+
+    def _collect(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+
+    for start in range(0, len(ids), BATCH_LIMIT):
+        batch = drive.new_batch_http_request(callback=_collect)
+        for fid in ids[start:start + BATCH_LIMIT]:
+            batch.add(drive.files().get(fileId=fid, fields=fields, **kwargs), request_id=fid)
+        batch.execute()
+    return results
+
+
 # Convenience wrappers for common services. These functions use standard scopes
 # as defined in the respective agents. Use these if you don't need custom
 # scopes.
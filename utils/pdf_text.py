@@ -0,0 +1,82 @@
+"""
+PDF text extraction shared by the Drive tools.
+
+Parsing is pure-Python and holds the GIL, so when several PDFs are read at
+once (e.g. scoring a folder of resumes) extract_many() spreads them over a
+small process pool instead of parsing them one after another. This module
+deliberately imports nothing from the agents so spawned workers start fast.
+
+Usage:
+
+    from utils import pdf_text
+
+    text = pdf_text.pdf_to_text(fh)                  # one file, in-process
+    results = pdf_text.extract_many([b1, b2, b3])     # str or Exception each
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, List, Optional, Union
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+# Smallest batch worth a process pool. Spawned workers re-import the parent's
+# __main__ script and pypdf before their first task, so smaller batches are
+# parsed in-process instead.
+MIN_POOL_BATCH = int(os.environ.get("PDF_POOL_MIN_BATCH", "4"))
+
+
+def pdf_to_text(source: Union[bytes, BinaryIO]) -> str:
+    """Return the text of every page, newline-joined and stripped."""
+    try:
+        import pypdf  # maintained successor of PyPDF2, same PdfReader API
+    except ImportError:
+        import PyPDF2 as pypdf
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    stream.seek(0)
+    reader = pypdf.PdfReader(stream)
+    return "\n".join([page.extract_text() or "" for page in reader.pages]).strip()
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # spawn, not fork: the parent runs threads (HTTP pools, agents).
+            _POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _POOL
+
+
+def extract_many(blobs: List[bytes]) -> List[Union[str, Exception]]:
+    """Parse several PDFs in parallel processes, preserving order.
+
+    Each entry is the extracted text or the exception raised for that file.
+    Batches smaller than MIN_POOL_BATCH are parsed in-process, where a pool
+    would only add start-up overhead.
+    """
+    if len(blobs) < max(MIN_POOL_BATCH, 2):
+        results: List[Union[str, Exception]] = []
+        for blob in blobs:
+            try:
+                results.append(pdf_to_text(blob))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    futures = [_pool().submit(pdf_to_text, blob) for blob in blobs]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
@@ -0,0 +1,157 @@
+"""
+Client-side rate limiting and retries for Google API requests.
+
+Drive enforces roughly 10 write requests per second per user and answers
+bursts with 429/5xx errors. Rather than surfacing those immediately, agents
+execute requests through this module, which:
+
+  - acquires a token from a process-wide token bucket before each call
+    (reads and writes draw from separate buckets, so a burst of writes
+    never stalls listings), and
+  - retries 429 responses, plus 500/502/503/504 for idempotent requests,
+    with jittered exponential backoff, honoring the server's Retry-After
+    header (capped at MAX_RETRY_AFTER seconds) when one is present.
+
+A 5xx on a POST (files.create, documents.batchUpdate, ...) may have been
+applied before the error, so retrying it could duplicate a file or an
+append. Requests are treated as idempotent by HTTP method (GET, HEAD, PUT,
+DELETE); pass idempotent=True for POSTs that are safe to repeat, such as
+values.batchUpdate overwriting fixed ranges.
+
+Usage:
+
+    from utils.rate_limit import execute
+
+    resp = execute(drive.files().list(**params))
+    doc = execute(docs.documents().get(documentId=doc_id), http=thread_http)
+    execute(sheets.spreadsheets().values().batchUpdate(...), idempotent=True)
+
+Configuration (environment variables):
+    GOOGLE_API_RATE: sustained write requests per second (default 10).
+    GOOGLE_API_BURST: write bucket capacity (default 20).
+    GOOGLE_API_READ_RATE: sustained read requests per second (default 25).
+    GOOGLE_API_READ_BURST: read bucket capacity (default 50).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from googleapiclient.errors import HttpError
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Statuses that prove a write was rejected without being applied.
+WRITE_RETRY_STATUSES = {429}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+MAX_ATTEMPTS = 6
+# Longest Retry-After honored; a larger value would stall the agent turn.
+MAX_RETRY_AFTER = 60.0
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_READ_BUCKET = TokenBucket(
+    rate=float(os.environ.get("GOOGLE_API_READ_RATE", "25")),
+    capacity=float(os.environ.get("GOOGLE_API_READ_BURST", "50")),
+)
+_WRITE_BUCKET = TokenBucket(
+    rate=float(os.environ.get("GOOGLE_API_RATE", "10")),
+    capacity=float(os.environ.get("GOOGLE_API_BURST", "20")),
+)
+
+_jitter = wait_exponential_jitter(initial=1, max=60)
+
+
+def _retryable_on(statuses) -> Callable[[BaseException], bool]:
+    return lambda exc: isinstance(exc, HttpError) and exc.resp.status in statuses
+
+
+def _wait(retry_state) -> float:
+    """Honor Retry-After (up to MAX_RETRY_AFTER) when sent; otherwise jittered backoff."""
+    exc = retry_state.outcome.exception()
+    retry_after = exc.resp.get("retry-after") if isinstance(exc, HttpError) else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_AFTER)
+    return _jitter(retry_state)
+
+
+def retry_api(func: Optional[F] = None, *, bucket: TokenBucket = _READ_BUCKET, statuses=RETRY_STATUSES):
+    """Decorate a function that performs one API call with throttling + retries.
+
+    The defaults suit idempotent reads; pass bucket=_WRITE_BUCKET and
+    statuses=WRITE_RETRY_STATUSES for calls that must not be replayed on 5xx.
+    """
+    if func is None:
+        return lambda f: retry_api(f, bucket=bucket, statuses=statuses)
+
+    @retry(
+        retry=retry_if_exception(_retryable_on(statuses)),
+        wait=_wait,
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        reraise=True,
+    )
+    def wrapper(*args, **kwargs):
+        bucket.acquire()
+        return func(*args, **kwargs)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper  # type: ignore[return-value]
+
+
+def _run(request, **kwargs) -> Any:
+    return request.execute(**kwargs)
+
+
+_execute_read = retry_api(_run)
+_execute_idempotent_write = retry_api(_run, bucket=_WRITE_BUCKET)
+_execute_write = retry_api(_run, bucket=_WRITE_BUCKET, statuses=WRITE_RETRY_STATUSES)
+
+
+def execute(request, *, idempotent: Optional[bool] = None, **kwargs) -> Any:
+    """Execute a googleapiclient request under the shared rate limit.
+
+    idempotent defaults to what the request's HTTP method implies; only
+    idempotent requests are retried on 5xx. GETs use the read bucket and
+    everything else the write bucket.
+    """
+    method = getattr(request, "method", "GET").upper()
+    if method in ("GET", "HEAD"):
+        return _execute_read(request, **kwargs)
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+    if idempotent:
+        return _execute_idempotent_write(request, **kwargs)
+    return _execute_write(request, **kwargs)
@@ -1,5 +1,6 @@
 # personalPlanner/utils/routing.py
 from __future__ import annotations
+import functools
 import os
 from pathlib import Path
 from typing import Iterable
@@ -10,8 +11,16 @@ from typing import Iterable
 _MARKERS: Iterable[str] = (".creds", ".cred", "pyproject.toml", ".git")
 
 def find_project_root(start: str | Path) -> Path:
-    """Walk upward from 'start' until we find a marker that identifies the repo root."""
-    p = Path(start).resolve()
+    """Walk upward from 'start' until we find a marker that identifies the repo root.
+
+    The walk is memoized per resolved start path, so modules that call this
+    (directly or via ensure_google_oauth_env) at import only stat once.
+    """
+    return _find_project_root(Path(start).resolve())
+
+
+@functools.lru_cache(maxsize=None)
+def _find_project_root(p: Path) -> Path:
     for a in [p] + list(p.parents):
         if any((a / m).exists() for m in _MARKERS):
             return a
@@ -26,6 +35,35 @@ def _first_existing(*paths: Path) -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _creds_dir(root: Path) -> Path:
+    # Prefer .creds over .cred; fall back to whichever exists.
+    creds_dir = _first_existing(root / ".creds", root / ".cred")
+    # If neither directory exists, pick .creds as default.  This way the error
+    # message will point to .creds even if it hasn't been created yet.
+    return creds_dir if creds_dir is not None else root / ".creds"
+
+
+@functools.lru_cache(maxsize=None)
+def load_project_env(root: Path) -> Path | None:
+    """
+    Load the project's .env once per process and return its path.
+
+    Checks ``.creds/.env``, ``.cred/.env`` and ``.env`` under ``root`` and loads
+    the first that exists. Later calls for the same root return the cached
+    result without touching the filesystem. Returns None if no file exists or
+    python-dotenv is not installed (env vars must then come from the OS).
+    """
+    try:
+        from dotenv import load_dotenv  # type: ignore
+    except ImportError:
+        return None
+    env_path = _first_existing(root / ".creds" / ".env", root / ".cred" / ".env", root / ".env")
+    if env_path is not None:
+        load_dotenv(env_path)
+    return env_path
+
+
 def ensure_google_oauth_env(start: str | Path) -> dict:
     """
     Set GOOGLE_OAUTH_CLIENT_FILE and GOOGLE_OAUTH_TOKEN_FILE environment variables to
@@ -45,12 +83,7 @@ def ensure_google_oauth_env(start: str | Path) -> dict:
         diagnostic purposes.
     """
     root = find_project_root(start)
-    # Prefer .creds over .cred; fall back to whichever exists.
-    creds_dir = _first_existing(root / ".creds", root / ".cred")
-    # If neither directory exists, pick .creds as default.  This way the error
-    # message will point to .creds even if it hasn't been created yet.
-    if creds_dir is None:
-        creds_dir = root / ".creds"
+    creds_dir = _creds_dir(root)
 
     default_client = creds_dir / "credentials.json"
     default_token = creds_dir / "token.json"
@@ -20,6 +20,13 @@ Functions:
     get_current_datetime(tz: Optional[str] = None) -> datetime
         Return a timezone-aware datetime object for the current moment.
 
+    local_timezone() -> tzinfo
+        Return the local timezone, cached for the life of the process.
+
+    get_time_context_raw(preferred_tz: Optional[str] = None) -> tuple
+        Like get_time_context, but also return the underlying datetime so
+        callers can format it further without re-parsing the ISO string.
+
 Note:
     These functions rely on the tzlocal library to detect the local
     timezone when no preferred timezone is specified. They fall back to
@@ -30,10 +37,73 @@ Note:
 from __future__ import annotations
 
 import datetime
+import functools
+import time
 from typing import Optional
 from zoneinfo import ZoneInfo
 from tzlocal import get_localzone
 
+_FALLBACK_TZ = "America/New_York"
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_tz(name: Optional[str] = None) -> datetime.tzinfo:
+    """Return the tzinfo for ``name`` (or the local zone), cached per name.
+
+    get_localzone() reads /etc/localtime and parses tzdata on every call, so
+    resolving once per process keeps repeated time lookups to a dict hit.
+    The local zone is used as returned, since it may have no IANA key to
+    rebuild a ZoneInfo from. Unknown names, or a failed local lookup, fall
+    back to America/New_York, as before.
+    """
+    try:
+        return ZoneInfo(name) if name else get_localzone()
+    except Exception:
+        return ZoneInfo(_FALLBACK_TZ)
+
+
+def local_timezone() -> datetime.tzinfo:
+    """Return the process-local timezone, resolved once and cached."""
+    return _resolve_tz(None)
+
+
+# One strftime call yields date, time, weekday and UTC offset, split on \x1f
+# (a NUL separator would truncate the output).
+_CONTEXT_FORMAT = "\x1f".join(["%Y-%m-%d", "%H:%M:%S", "%A", "%z"])
+
+# strftime format for the Docs/Drive "modified time" tools: date, time,
+# weekday and a human-readable summary, split on \x1f like _CONTEXT_FORMAT.
+MODIFIED_TIME_FORMAT = "\x1f".join(
+    ["%Y-%m-%d", "%H:%M:%S", "%A", "Last modified on %A, %b %d %Y at %I:%M %p %Z"]
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _time_context_at(preferred_tz: Optional[str], second: int) -> tuple:
+    """Build the (datetime, context) pair; memoized per timezone and wall-clock second."""
+    tz = _resolve_tz(preferred_tz)
+    now = datetime.datetime.now(tz)
+    date, time_str, weekday, utc_offset = now.strftime(_CONTEXT_FORMAT).split("\x1f")
+    return now, {
+        "datetime": now.isoformat(),
+        "date": date,
+        "time": time_str,
+        "weekday": weekday,
+        "timezone": str(tz),
+        "utc_offset": utc_offset,
+    }
+
+
+def get_time_context_raw(preferred_tz: Optional[str] = None) -> tuple:
+    """Return ``(now, context)`` where context is the get_time_context dict.
+
+    Calls within the same second for the same timezone reuse one computed
+    context. The dict is a fresh copy, so callers may add keys to it.
+    """
+    now, ctx = _time_context_at(preferred_tz, int(time.time()))
+    return now, dict(ctx)
+
+
 def get_time_context(preferred_tz: Optional[str] = None) -> dict:
     """Return current date, time, and timezone information.
 
@@ -51,20 +121,7 @@ def get_time_context(preferred_tz: Optional[str] = None) -> dict:
             - 'timezone': Timezone name
             - 'utc_offset': Offset from UTC in ±HHMM format
     """
-    try:
-        tz = ZoneInfo(preferred_tz) if preferred_tz else get_localzone()
-    except Exception:
-        tz = ZoneInfo("America/New_York")
-
-    now = datetime.datetime.now(tz)
-    return {
-        "datetime": now.isoformat(),
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "weekday": now.strftime("%A"),
-        "timezone": str(tz),
-        "utc_offset": now.strftime("%z"),
-    }
+    return get_time_context_raw(preferred_tz)[1]
 
 
 def ensure_rfc3339(dt_str: Optional[str], tz: Optional[ZoneInfo] = None) -> str:
@@ -84,7 +141,7 @@ def ensure_rfc3339(dt_str: Optional[str], tz: Optional[ZoneInfo] = None) -> str:
         A string representing the datetime in ISO 8601 format with
         timezone information (RFC3339).
     """
-    tz = tz or get_localzone()
+    tz = tz or _resolve_tz()
     if not dt_str:
         return datetime.datetime.now(tz).isoformat()
 
@@ -115,8 +172,4 @@ def get_current_datetime(tz: Optional[str] = None) -> datetime.datetime:
     Returns:
         A timezone-aware datetime object representing now.
     """
-    try:
-        zone = ZoneInfo(tz) if tz else get_localzone()
-    except Exception:
-        zone = ZoneInfo("America/New_York")
-    return datetime.datetime.now(zone)
+    return datetime.datetime.now(_resolve_tz(tz))